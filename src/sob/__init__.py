@@ -70,6 +70,7 @@ from sob.model import (
     Object,
     deserialize,
     get_model_from_meta,
+    get_models_from_meta,
     get_models_source,
     marshal,
     replace_model_nulls,
@@ -153,6 +154,7 @@ __all__: tuple[str, ...] = (
     "get_model_hooks_type",
     "get_model_pointer",
     "get_model_url",
+    "get_models_from_meta",
     "get_models_source",
     "get_writable_array_hooks",
     "get_writable_array_meta",
@@ -179,6 +179,7 @@ class Hooks(metaclass=ABCMeta):
     after_serialize: Callable[[str], str] | None
     before_validate: Callable[[Model], Any] | None
     after_validate: Callable[[Model], None] | None
+    before_unmarshal_mutates_data: bool
 
     @abstractmethod
     def __init__(
@@ -194,6 +195,8 @@ class Hooks(metaclass=ABCMeta):
         after_serialize: Callable[[str], str] | None = None,
         before_validate: Callable[[Model], Model] | None = None,
         after_validate: Callable[[Model], None] | None = None,
+        *,
+        before_unmarshal_mutates_data: bool = True,
     ) -> None:
         pass
 
@@ -251,6 +254,8 @@ class ObjectHooks(Hooks, metaclass=ABCMeta):
         | None = None,
         after_setitem: Callable[[Object, str, MarshallableTypes], None]
         | None = None,
+        *,
+        before_unmarshal_mutates_data: bool = True,
     ) -> None:
         pass
 
@@ -290,6 +295,8 @@ class ArrayHooks(Hooks, metaclass=ABCMeta):
         before_append: Callable[[Array, MarshallableTypes], Any | None]
         | None = None,
         after_append: Callable[[Array, MarshallableTypes], None] | None = None,
+        *,
+        before_unmarshal_mutates_data: bool = True,
     ) -> None:
         pass
 
@@ -325,6 +332,8 @@ class DictionaryHooks(Hooks, metaclass=ABCMeta):
         | None = None,
         after_setitem: Callable[[Dictionary, str, MarshallableTypes], None]
         | None = None,
+        *,
+        before_unmarshal_mutates_data: bool = True,
     ) -> None:
         pass
 
@@ -597,6 +606,7 @@ class Model(metaclass=ABCMeta):
     """
 
     _source: str | None
+    _parsed_source: tuple[str, tuple[str, ...], str] | None
     _pointer: str | None
     _url: str | None
     _class_meta: Meta | None
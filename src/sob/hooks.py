@@ -84,6 +84,11 @@ class Hooks(abc.Hooks):  # pragma: no cover
             The `after_validate` function should accept an instance of the
             class to which it is associated as the only argument, and must
             return an instance of that class as the return value.
+        before_unmarshal_mutates_data: If `True` (the default), a deep
+            copy of the data is passed to `before_unmarshal`, so that the
+            hook cannot alter the data being un-marshalled. This can be set
+            to `False` for `before_unmarshal` hooks which do not modify
+            their input, in order to avoid the cost of copying the data.
     """
 
     __module__: str = "sob"
@@ -99,6 +104,8 @@ class Hooks(abc.Hooks):  # pragma: no cover
         after_serialize: Callable[[str], str] | None = None,
         before_validate: Callable[[abc.Model], abc.Model] | None = None,
         after_validate: Callable[[abc.Model], None] | None = None,
+        *,
+        before_unmarshal_mutates_data: bool = True,
     ):
         self.before_marshal = before_marshal
         self.after_marshal = after_marshal
@@ -108,6 +115,7 @@ class Hooks(abc.Hooks):  # pragma: no cover
         self.after_serialize = after_serialize
         self.before_validate = before_validate
         self.after_validate = after_validate
+        self.before_unmarshal_mutates_data = before_unmarshal_mutates_data
 
     def __copy__(self) -> Hooks:
         return self.__class__(**vars(self))
@@ -213,6 +221,11 @@ class ObjectHooks(Hooks, abc.ObjectHooks):
             positional arguments: an instance of the class to which it is
             associated, the item key, and the value assigned to that
             key. The function should return `None`.
+        before_unmarshal_mutates_data: If `True` (the default), a deep
+            copy of the data is passed to `before_unmarshal`, so that the
+            hook cannot alter the data being un-marshalled. This can be set
+            to `False` for `before_unmarshal` hooks which do not modify
+            their input, in order to avoid the cost of copying the data.
     """
 
     __module__: str = "sob"
@@ -240,6 +253,8 @@ class ObjectHooks(Hooks, abc.ObjectHooks):
         | None = None,
         after_setitem: Callable[[abc.Object, str, MarshallableTypes], None]
         | None = None,
+        *,
+        before_unmarshal_mutates_data: bool = True,
     ) -> None:
         super().__init__(
             before_marshal=before_marshal,
@@ -250,6 +265,7 @@ class ObjectHooks(Hooks, abc.ObjectHooks):
             after_serialize=after_serialize,
             before_validate=before_validate,
             after_validate=after_validate,
+            before_unmarshal_mutates_data=before_unmarshal_mutates_data,
         )
         self.before_setattr = before_setattr
         self.after_setattr = after_setattr
@@ -351,6 +367,11 @@ class ArrayHooks(Hooks, abc.ArrayHooks):
             positional arguments: an instance of the class to which it is
             associated, and the value appended. The function should
             return `None`.
+        before_unmarshal_mutates_data: If `True` (the default), a deep
+            copy of the data is passed to `before_unmarshal`, so that the
+            hook cannot alter the data being un-marshalled. This can be set
+            to `False` for `before_unmarshal` hooks which do not modify
+            their input, in order to avoid the cost of copying the data.
     """
 
     __module__: str = "sob"
@@ -378,6 +399,8 @@ class ArrayHooks(Hooks, abc.ArrayHooks):
         | None = None,
         after_append: Callable[[abc.Array, MarshallableTypes], None]
         | None = None,
+        *,
+        before_unmarshal_mutates_data: bool = True,
     ) -> None:
         super().__init__(
             before_marshal=before_marshal,
@@ -388,6 +411,7 @@ class ArrayHooks(Hooks, abc.ArrayHooks):
             after_serialize=after_serialize,
             before_validate=before_validate,
             after_validate=after_validate,
+            before_unmarshal_mutates_data=before_unmarshal_mutates_data,
         )
         self.before_setitem = before_setitem
         self.after_setitem = after_setitem
@@ -479,6 +503,11 @@ class DictionaryHooks(Hooks, abc.DictionaryHooks):
             positional arguments: an instance of the class to which it is
             associated, the item key, and the value assigned to that
             key. The function should return `None`.
+        before_unmarshal_mutates_data: If `True` (the default), a deep
+            copy of the data is passed to `before_unmarshal`, so that the
+            hook cannot alter the data being un-marshalled. This can be set
+            to `False` for `before_unmarshal` hooks which do not modify
+            their input, in order to avoid the cost of copying the data.
     """
 
     __module__: str = "sob"
@@ -501,6 +530,8 @@ class DictionaryHooks(Hooks, abc.DictionaryHooks):
         | None = None,
         after_setitem: Callable[[abc.Dictionary, str, MarshallableTypes], None]
         | None = None,
+        *,
+        before_unmarshal_mutates_data: bool = True,
     ):
         super().__init__(
             before_marshal=before_marshal,
@@ -511,6 +542,7 @@ class DictionaryHooks(Hooks, abc.DictionaryHooks):
             after_serialize=after_serialize,
             before_validate=before_validate,
             after_validate=after_validate,
+            before_unmarshal_mutates_data=before_unmarshal_mutates_data,
         )
         self.before_setitem = before_setitem
         self.after_setitem = after_setitem
@@ -533,21 +565,13 @@ def read_model_hooks(model: type | abc.Model) -> abc.Hooks | None:
     """
     message: str
     if isinstance(model, abc.Model):
-        return getattr(model, "_instance_hooks", None) or read_model_hooks(
-            type(model)
+        return getattr(model, "_instance_hooks", None) or getattr(
+            type(model), "_class_hooks", None
         )
     if isinstance(model, type) and issubclass(model, abc.Model):
-        base: type
-        try:
-            return next(
-                getattr(base, "_class_hooks", None)
-                for base in filter(
-                    lambda base: issubclass(base, abc.Model),
-                    model.__mro__,
-                )
-            )
-        except StopIteration:
-            return None
+        # Class attribute look-ups already resolve inheritance (and are
+        # cached by the interpreter), so there is no need to walk the MRO
+        return getattr(model, "_class_hooks", None)
     repr_model: str = represent(model)
     message = (
         "{} requires a parameter which is an instance or sub-class of "
@@ -301,8 +301,9 @@ class Properties(abc.Properties):
 
     def __setitem__(self, key: str, value: abc.Property) -> None:
         if not isinstance(value, abc.Property):
-            if value in TYPES_PROPERTIES:
-                value = TYPES_PROPERTIES[value]()
+            property_type: type | None = TYPES_PROPERTIES.get(value)
+            if property_type is not None:
+                value = property_type()
             else:
                 message: str = (
                     f"Cannot set `{key}={value!r}`, as properties must be "
@@ -472,21 +473,13 @@ def read_model_meta(model: type | abc.Model) -> abc.Meta | None:
     """
     message: str
     if isinstance(model, abc.Model):
-        return getattr(model, "_instance_meta", None) or read_model_meta(
-            type(model)
+        return getattr(model, "_instance_meta", None) or getattr(
+            type(model), "_class_meta", None
         )
     if isinstance(model, type) and issubclass(model, abc.Model):
-        base: type | None
-        try:
-            return next(
-                getattr(base, "_class_meta", None)
-                for base in filter(
-                    lambda base: issubclass(base, abc.Model),
-                    model.__mro__,
-                )
-            )
-        except StopIteration:
-            return None
+        # Class attribute look-ups already resolve inheritance (and are
+        # cached by the interpreter), so there is no need to walk the MRO
+        return getattr(model, "_class_meta", None)
     repr_model: str = represent(model)
     message = (
         "{} requires a parameter which is an instance or sub-class of "
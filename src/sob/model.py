@@ -23,12 +23,16 @@ from collections.abc import (
     Sequence,
     ValuesView,
 )
+from collections.abc import Set as AbstractSet
 from copy import copy, deepcopy
 from datetime import date, datetime
 from decimal import Decimal
+from functools import lru_cache
 from inspect import signature
 from itertools import chain
-from types import GeneratorType
+from operator import itemgetter
+from re import Pattern
+from types import CodeType, GeneratorType
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -61,6 +65,24 @@ from sob.utilities import (
 )
 from sob.utilities import indent as indent_
 
+# Used as a sort key for `(key, value)` item tuples
+_get_item_key: Callable[[tuple[str, Any]], str] = itemgetter(0)
+
+# Immutable types, instances of which can be shared rather than deep-copied
+_IMMUTABLE_TYPES: frozenset[type] = frozenset(
+    (str, int, float, bool, bytes, Decimal, date, datetime, Null)
+)
+
+
+@lru_cache(maxsize=1024)
+def _get_type_qualified_name(type_: type) -> str:
+    """
+    This function returns the qualified name of a type, caching the result
+    since the same types are named repeatedly in representations, error
+    messages and generated source code.
+    """
+    return get_qualified_name(type_)
+
 
 class Model(abc.Model):
     """
@@ -81,6 +103,7 @@ class Model(abc.Model):
     )
 
     _source: str | None = None
+    _parsed_source: tuple[str, tuple[str, ...], str] | None = None
     _class_meta: abc.Meta | None = None
     _class_hooks: abc.Hooks | None = None
 
@@ -604,7 +627,7 @@ class Array(Model, abc.Array, abc.Model):
         recreate the item
         """
         item_representation = (
-            get_qualified_name(item)
+            _get_type_qualified_name(item)
             if isinstance(item, type)
             else represent(item)
         )
@@ -618,7 +641,7 @@ class Array(Model, abc.Array, abc.Model):
         # used to recreate the array
         instance_meta: abc.ArrayMeta | None = meta.read_array_meta(self)
         class_meta: abc.ArrayMeta | None = meta.read_array_meta(type(self))
-        representation_lines = [get_qualified_name(type(self)) + "("]
+        representation_lines = [_get_type_qualified_name(type(self)) + "("]
         if len(self) > 0:
             representation_lines.append("    [")
             representation_lines.extend(map(self._repr_item, self))
@@ -951,14 +974,18 @@ class Dictionary(Model, abc.Dictionary, abc.Model):
     ) -> None:
         if data is not None:
             items: Iterable[tuple[str, abc.MarshallableTypes]]
-            if isinstance(data, (dict, abc.Dictionary)) or (
-                isinstance(data, Mapping) and isinstance(data, Reversible)
+            # A `dict` is checked for by exact type first, since this is
+            # much faster than an abstract base class instance check
+            if (type(data) is dict) or (
+                isinstance(data, (Mapping, abc.Dictionary))
+                and isinstance(data, (dict, abc.Dictionary, Reversible))
             ):
-                items = data.items()
+                items = data.items()  # type: ignore
             elif isinstance(data, Mapping):
-                items = sorted(data.items(), key=lambda item: item[0])
+                # Mappings without a defined order are sorted by key
+                items = sorted(data.items(), key=_get_item_key)
             else:
-                items = data
+                items = cast(Iterable[tuple[str, abc.MarshallableTypes]], data)
             key: str
             value: abc.MarshallableTypes
             for key, value in items:
@@ -1017,11 +1044,11 @@ class Dictionary(Model, abc.Dictionary, abc.Model):
                 value, types=value_types or ()
             )
         except TypeError as error:
-            message = f"\n - {get_qualified_name(type(self))}['{key}']: {{}}"
+            message = (
+                f"\n - {_get_type_qualified_name(type(self))}['{key}']: {{}}"
+            )
             if error.args and isinstance(error.args[0], str):
-                error.args = tuple(
-                    chain((message.format(error.args[0]),), error.args[1:])
-                )
+                error.args = (message.format(error.args[0]), *error.args[1:])
             else:
                 error.args = (message.format(represent(value)),)
             raise
@@ -1033,7 +1060,7 @@ class Dictionary(Model, abc.Dictionary, abc.Model):
             instance_hooks.after_setitem(self, key, unmarshalled_value)
 
     def __copy__(self) -> abc.Dictionary:
-        new_instance: abc.Dictionary = self.__class__()
+        new_instance: Dictionary = self.__class__()
         instance_meta: abc.DictionaryMeta | None = meta.read_dictionary_meta(
             self
         )
@@ -1050,6 +1077,14 @@ class Dictionary(Model, abc.Dictionary, abc.Model):
         )
         if instance_hooks is not class_hooks:
             hooks.write_model_hooks(new_instance, instance_hooks)
+        if instance_meta is class_meta and not (
+            instance_hooks
+            and (instance_hooks.before_setitem or instance_hooks.after_setitem)
+        ):
+            # The values have already been unmarshalled in accordance with the
+            # class metadata, so they can be copied without re-assignment
+            new_instance._dict = dict(self._dict)  # noqa: SLF001
+            return new_instance
         key: str
         value: abc.MarshallableTypes
         for key, value in self.items():
@@ -1096,12 +1131,16 @@ class Dictionary(Model, abc.Dictionary, abc.Model):
         # This variable is needed because before-marshal hooks are permitted to
         # return altered *copies* of `self`, so prior to marshalling--this
         # variable may no longer point to `self`
-        data: abc.Model = self
+        data: abc.Dictionary = self
         # Execute before-marshal hooks, if applicable
         if instance_hooks and instance_hooks.before_marshal:
-            data = instance_hooks.before_marshal(data)
-        if not isinstance(data, abc.Dictionary):
-            raise TypeError(data)
+            before_marshal_data: abc.Model = instance_hooks.before_marshal(
+                data
+            )
+            # Only a hook can have substituted something other than `self`
+            if not isinstance(before_marshal_data, abc.Dictionary):
+                raise TypeError(before_marshal_data)
+            data = before_marshal_data
         # Get the metadata, if any has been assigned
         instance_meta: abc.DictionaryMeta | None = meta.read_dictionary_meta(
             data
@@ -1111,8 +1150,10 @@ class Dictionary(Model, abc.Dictionary, abc.Model):
             instance_meta.value_types if instance_meta else None
         )
         # Recursively convert the data to generic, serializable, data types
+        # (`marshal` is bound locally to avoid a global lookup per item)
+        marshal_: Callable[..., abc.JSONTypes] = marshal
         marshalled_data: dict[str, abc.JSONTypes] = {
-            key: marshal(value, types=value_types)
+            key: marshal_(value, types=value_types)
             for key, value in data.items()
         }
         # Execute after-marshal hooks, if applicable
@@ -1133,9 +1174,7 @@ class Dictionary(Model, abc.Dictionary, abc.Model):
                 if not isinstance(after_marshal_data, Mapping):
                     raise TypeError(after_marshal_data)
                 after_marshal_dictionary = dict(
-                    sorted(
-                        after_marshal_data.items(), key=lambda item: item[0]
-                    )
+                    sorted(after_marshal_data.items(), key=_get_item_key)
                 )
             marshalled_data = after_marshal_dictionary
         return marshalled_data
@@ -1171,31 +1210,29 @@ class Dictionary(Model, abc.Dictionary, abc.Model):
     @staticmethod
     def _repr_item(key: str, value: Any) -> str:
         value_representation = (
-            get_qualified_name(value)
+            _get_type_qualified_name(value)
             if isinstance(value, type)
             else represent(value)
         )
+        # Most values are represented on a single line, in which case there
+        # is no need to split and re-indent the representation
+        if "\n" not in value_representation:
+            return f"        ({represent(key)}, {value_representation}),"
         value_representation_lines = value_representation.split("\n")
-        if len(value_representation_lines) > 1:
-            indented_lines = [value_representation_lines[0]]
-            line: str
-            indented_lines.extend(
-                f"            {line}"
-                for line in value_representation_lines[1:]
-            )
-            value_representation = "\n".join(indented_lines)
-            representation = "\n".join(
-                [
-                    "        (",
-                    f"            {represent(key)},",
-                    f"            {value_representation}",
-                    "        ),",
-                ]
-            )
-        else:
-            representation = (
-                f"        ({represent(key)}, {value_representation}),"
-            )
+        indented_lines = [value_representation_lines[0]]
+        line: str
+        indented_lines.extend(
+            f"            {line}" for line in value_representation_lines[1:]
+        )
+        value_representation = "\n".join(indented_lines)
+        representation = "\n".join(
+            [
+                "        (",
+                f"            {represent(key)},",
+                f"            {value_representation}",
+                "        ),",
+            ]
+        )
         return representation
 
     def __repr__(self) -> str:
@@ -1208,7 +1245,7 @@ class Dictionary(Model, abc.Dictionary, abc.Model):
             self
         )
         representation_lines: list[str] = [
-            get_qualified_name(type(self)) + "("
+            _get_type_qualified_name(type(self)) + "("
         ]
         items: tuple[tuple[str, abc.MarshallableTypes], ...] = tuple(
             self.items()
@@ -1609,13 +1646,11 @@ class Object(Model, abc.Object, abc.Model):
                     )
                 except TypeError as error:
                     label: str = (
-                        f"\n - {get_qualified_name(type(self))}."
+                        f"\n - {_get_type_qualified_name(type(self))}."
                         f"{property_name_}: "
                     )
                     if error.args:
-                        error.args = tuple(
-                            chain((label + error.args[0],), error.args[1:])
-                        )
+                        error.args = (label + error.args[0], *error.args[1:])
                     else:
                         error.args = (label + serialize(other),)
                     raise
@@ -1638,7 +1673,7 @@ class Object(Model, abc.Object, abc.Model):
             except (KeyError, AttributeError):
                 pass
         message: str = (
-            f"`{get_qualified_name(type(self))}` has no attribute "
+            f"`{_get_type_qualified_name(type(self))}` has no attribute "
             f'"{property_name_}".'
         )
         raise KeyError(message)
@@ -1651,18 +1686,17 @@ class Object(Model, abc.Object, abc.Model):
         """
         property_definition = self._get_property_definition(property_name_)
         if value is not None:
-            if isinstance(value, GeneratorType):
+            if type(value) is GeneratorType:
                 value = tuple(value)
             try:
                 value = _unmarshal_property_value(property_definition, value)
             except (TypeError, ValueError) as error:
                 message: str = (
-                    f"\n - {get_qualified_name(type(self))}.{property_name_}: "
+                    f"\n - {_get_type_qualified_name(type(self))}."
+                    f"{property_name_}: "
                 )
                 if error.args and isinstance(error.args[0], str):
-                    error.args = tuple(
-                        chain((message + error.args[0],), error.args[1:])
-                    )
+                    error.args = (message + error.args[0], *error.args[1:])
                 else:
                     error.args = (message + represent(value),)
                 raise
@@ -1671,23 +1705,22 @@ class Object(Model, abc.Object, abc.Model):
     def __setattr__(
         self, property_name_: str, value: abc.MarshallableTypes
     ) -> None:
+        # Private attributes are neither un-marshalled nor passed to hooks
+        if property_name_[0] == "_":
+            object.__setattr__(self, property_name_, value)
+            return
         unmarshalled_value: abc.MarshallableTypes = value
         instance_hooks: abc.ObjectHooks | None = hooks.read_object_hooks(self)
-        if property_name_[0] != "_":
-            if instance_hooks and instance_hooks.before_setattr:
-                property_name_, value = instance_hooks.before_setattr(
-                    self, property_name_, value
-                )
-            if value is not None:
-                unmarshalled_value = self._unmarshal_value(
-                    property_name_, value
-                )
+        if instance_hooks and instance_hooks.before_setattr:
+            property_name_, value = instance_hooks.before_setattr(
+                self, property_name_, value
+            )
+        # `None` values (such as the defaults assigned by a model's
+        # `__init__`) are stored as-is, without any un-marshalling
+        if value is not None:
+            unmarshalled_value = self._unmarshal_value(property_name_, value)
         object.__setattr__(self, property_name_, unmarshalled_value)
-        if (
-            property_name_[0] != "_"
-            and instance_hooks
-            and instance_hooks.after_setattr
-        ):
+        if instance_hooks and instance_hooks.after_setattr:
             instance_hooks.after_setattr(self, property_name_, value)
 
     def _get_key_property_name(self, key: str) -> str | None:
@@ -1717,9 +1750,10 @@ class Object(Model, abc.Object, abc.Model):
         property_name_: str | None = self._get_key_property_name(key)
         if property_name_ is None:
             # Store the extraneous attribute in our extras dictionary
-            if self._extra is None:
-                self._extra = {}
-            self._extra[key] = value
+            extra: dict[str, abc.MarshallableTypes] | None = self._extra
+            if extra is None:
+                extra = self._extra = {}
+            extra[key] = value
         else:
             # Set the attribute value
             self.__setattr__(property_name_, value)
@@ -1743,9 +1777,10 @@ class Object(Model, abc.Object, abc.Model):
     def __delitem__(self, key: str) -> None:
         property_name: str | None = self._get_key_property_name(key)
         if property_name is None:
-            if self._extra is None:
+            extra: dict[str, abc.MarshallableTypes] | None = self._extra
+            if extra is None:
                 raise KeyError(key)
-            del self._extra[key]
+            del extra[key]
         else:
             self.__delattr__(property_name)
 
@@ -1754,9 +1789,10 @@ class Object(Model, abc.Object, abc.Model):
         # operators `[]` by looking up the attributes in the object metadata.
         property_name: str | None = self._get_key_property_name(key)
         if property_name is None:
-            if self._extra is None:
+            extra: dict[str, abc.MarshallableTypes] | None = self._extra
+            if extra is None:
                 raise KeyError(key)
-            return self._extra[key]
+            return extra[key]
         return cast("abc.MarshallableTypes", getattr(self, property_name))
 
     def __copy__(self) -> abc.Object:
@@ -1773,18 +1809,34 @@ class Object(Model, abc.Object, abc.Model):
         """
         try:
             value = getattr(self, property_name_)
-            if isinstance(value, GeneratorType):
+            # Most unset properties are `None`, so we check for that first
+            if value is None:
+                return
+            # Values which were unmarshalled when assigned to this object
+            # can be copied to `other` without being unmarshalled again,
+            # provided there are no set-attribute hooks to run
+            unmarshalled: bool = True
+            if type(value) is GeneratorType:
                 value = tuple(value)
-            if value is not None:
-                if not callable(value):
-                    value = deepcopy(value, memo=memo)
+                unmarshalled = False
+            if not (type(value) in _IMMUTABLE_TYPES or callable(value)):
+                value = deepcopy(value, memo=memo)
+            other_hooks: abc.ObjectHooks | None = hooks.read_object_hooks(
+                other
+            )
+            if unmarshalled and not (
+                other_hooks
+                and (other_hooks.before_setattr or other_hooks.after_setattr)
+            ):
+                object.__setattr__(other, property_name_, value)
+            else:
                 setattr(other, property_name_, value)
         except TypeError as error:
-            label: str = f"{get_qualified_name(type(self))}.{property_name_}: "
+            label: str = (
+                f"{_get_type_qualified_name(type(self))}.{property_name_}: "
+            )
             if error.args:
-                error.args = tuple(
-                    chain((label + error.args[0],), error.args[1:])
-                )
+                error.args = (label + error.args[0], *error.args[1:])
             else:
                 error.args = (label + serialize(self),)
             raise
@@ -1796,8 +1848,11 @@ class Object(Model, abc.Object, abc.Model):
         meta_: abc.ObjectMeta | None = meta.read_object_meta(self)
         # If there is metadata--copy it recursively
         if meta_ and meta_.properties:
+            deepcopy_property: Callable[
+                [str, abc.Object, dict | None], None
+            ] = self._deepcopy_property
             for property_name_ in meta_.properties:
-                self._deepcopy_property(property_name_, new_instance, memo)
+                deepcopy_property(property_name_, new_instance, memo)
         return new_instance
 
     def _marshal(self) -> dict[str, abc.JSONTypes]:
@@ -1813,13 +1868,19 @@ class Object(Model, abc.Object, abc.Model):
         data: dict[str, abc.JSONTypes] = {}
         instance_meta: abc.ObjectMeta | None = meta.read_object_meta(object_)
         if instance_meta and instance_meta.properties is not None:
+            # Bind frequently used callables locally, to avoid global
+            # look-ups for every property
+            getattr_: Callable[[abc.Object, str], Any] = getattr
+            marshal_property_value: Callable[
+                [abc.Property, abc.MarshallableTypes], abc.JSONTypes
+            ] = _marshal_property_value
             property_name_: str
             property_: abc.Property
             for property_name_, property_ in instance_meta.properties.items():
-                value: abc.JSONTypes = getattr(object_, property_name_)
+                value: abc.JSONTypes = getattr_(object_, property_name_)
                 if value is not None:
                     data[property_.name or property_name_] = (
-                        _marshal_property_value(property_, value)
+                        marshal_property_value(property_, value)
                     )
         if instance_hooks and instance_hooks.after_marshal:
             after_marshal_data: abc.JSONTypes = instance_hooks.after_marshal(
@@ -1837,7 +1898,7 @@ class Object(Model, abc.Object, abc.Model):
     def _repr_argument(parameter: str, value: abc.MarshallableTypes) -> str:
         value_representation: str
         if isinstance(value, type):
-            value_representation = get_qualified_name(value)
+            value_representation = _get_type_qualified_name(value)
         else:
             value_representation = represent(value)
         lines = value_representation.split("\n")
@@ -1850,45 +1911,58 @@ class Object(Model, abc.Object, abc.Model):
     def __repr__(self) -> str:
         # This returns a string representation of this object which can be
         # used to recreate the object
-        representation = [f"{get_qualified_name(type(self))}("]
         instance_meta: abc.ObjectMeta | None = meta.read_object_meta(self)
+        arguments: list[str] = []
         if instance_meta and instance_meta.properties:
+            repr_argument: Callable[[str, abc.MarshallableTypes], str] = (
+                self._repr_argument
+            )
             property_name_: str
             value: abc.MarshallableTypes
-            for property_name_ in instance_meta.properties:
-                value = getattr(self, property_name_)
-                if value is not None:
-                    representation.append(
-                        self._repr_argument(property_name_, value)
-                    )
-            # Strip the last comma
-            if representation:
-                representation[-1] = representation[-1].rstrip(",")
-        representation.append(")")
-        if len(representation) > 2:  # noqa: PLR2004
-            return "\n".join(representation)
-        return "".join(representation)
+            arguments = [
+                repr_argument(property_name_, value)
+                for property_name_, value in (
+                    (property_name_, getattr(self, property_name_))
+                    for property_name_ in instance_meta.properties
+                )
+                if value is not None
+            ]
+        if not arguments:
+            return f"{_get_type_qualified_name(type(self))}()"
+        # Strip the last comma
+        arguments[-1] = arguments[-1][:-1]
+        return "\n".join(
+            (
+                f"{_get_type_qualified_name(type(self))}(",
+                *arguments,
+                ")",
+            )
+        )
 
     def __eq__(self, other: abc.Any) -> bool:
+        if self is other:
+            return True
         if type(self) is not type(other):
             return False
         instance_meta: abc.ObjectMeta | None = meta.read_object_meta(self)
-        self_properties = set(
+        # Keys views compare as sets, so no sets need to be constructed
+        property_names: AbstractSet[str] = (
             instance_meta.properties.keys()
             if instance_meta and instance_meta.properties
-            else ()
+            else frozenset()
         )
         other_meta: abc.ObjectMeta | None = meta.read_object_meta(other)
-        other_properties = set(
+        # If both objects share the same metadata, their properties are
+        # necessarily the same
+        if other_meta is not instance_meta and property_names != (
             other_meta.properties.keys()
             if other_meta and other_meta.properties
-            else ()
-        )
-        if self_properties != other_properties:
+            else frozenset()
+        ):
             return False
         value: abc.MarshallableTypes
         other_value: abc.MarshallableTypes
-        for property_name_ in self_properties & other_properties:
+        for property_name_ in property_names:
             value = getattr(self, property_name_)
             other_value = getattr(other, property_name_)
             if value != other_value:
@@ -1907,7 +1981,9 @@ class Object(Model, abc.Object, abc.Model):
                 yield property_.name or property_name_
 
     def __contains__(self, key: str) -> bool:
-        return key in self.__iter__()
+        # This is equivalent to `key in self.__iter__()`, but only needs to
+        # scan the properties when `key` is not also a property name
+        return self._get_key_property_name(key) is not None
 
     def _get_property_validation_error_messages(
         self,
@@ -1919,34 +1995,40 @@ class Object(Model, abc.Object, abc.Model):
             if property_.required:
                 yield (
                     f"The property `{property_name_}` is required for "
-                    f"`{get_qualified_name(type(self))}`:\n{self!s}"
+                    f"`{_get_type_qualified_name(type(self))}`:\n{self!s}"
                 )
         elif value is NULL:
             if (property_.types is not None) and (Null not in property_.types):
                 yield (
                     "Null values are not allowed in `{}.{}`, "
                     "permitted types include: {}.".format(
-                        get_qualified_name(type(self)),
+                        _get_type_qualified_name(type(self)),
                         property_name_,
                         ", ".join(
                             "`{}`".format(
-                                get_qualified_name(type_)
+                                _get_type_qualified_name(type_)
                                 if isinstance(type_, type)
-                                else get_qualified_name(type(type_))
+                                else _get_type_qualified_name(type(type_))
                             )
                             for type_ in property_.types
                         ),
                     )
                 )
         else:
-            error_message: str
-            for error_message in validate(
+            error_messages: Sequence[str] = validate(
                 value, property_.types, raise_errors=False
-            ):
-                yield (
+            )
+            if error_messages:
+                # The message prefix is only built if there are errors,
+                # and only once per property
+                error_message_prefix: str = (
                     "Error encountered while attempting to validate "
-                    f"`{get_qualified_name(type(self))}.{property_name_}`:\n\n{error_message}"
+                    f"`{_get_type_qualified_name(type(self))}."
+                    f"{property_name_}`:\n\n"
                 )
+                error_message: str
+                for error_message in error_messages:
+                    yield error_message_prefix + error_message
 
     def _validate(self, *, raise_errors: bool = True) -> list[str]:
         """
@@ -1967,16 +2049,22 @@ class Object(Model, abc.Object, abc.Model):
             validated_object
         )
         if instance_meta and instance_meta.properties:
+            # Bind the per-property callables once, rather than looking them
+            # up for every property
+            get_property_validation_error_messages: Callable[
+                [str, abc.Property, abc.MarshallableTypes], Iterable[str]
+            ] = validated_object._get_property_validation_error_messages  # noqa: SLF001
+            extend_validation_error_messages: Callable[
+                [Iterable[str]], None
+            ] = validation_error_messages.extend
             property_name_: str
             property_: abc.Property
             for (
                 property_name_,
                 property_,
             ) in instance_meta.properties.items():
-                validation_error_messages.extend(
-                    (  # noqa: SLF001
-                        validated_object
-                    )._get_property_validation_error_messages(
+                extend_validation_error_messages(
+                    get_property_validation_error_messages(
                         property_name_,
                         property_,
                         getattr(validated_object, property_name_),
@@ -1987,7 +2075,7 @@ class Object(Model, abc.Object, abc.Model):
             if self._extra:
                 validation_error_messages.append(
                     f"Extraneous attribute(s) were provided for an instance "
-                    f"of `{get_qualified_name(type(self))}`:\n"
+                    f"of `{_get_type_qualified_name(type(self))}`:\n"
                     f"{represent(self._extra)}"
                 )
             if raise_errors and validation_error_messages:
@@ -2012,7 +2100,27 @@ def _marshal_collection(
     if isinstance(data, (Mapping, abc.Dictionary)):
         return _marshal_mapping(data, value_types)
     value: abc.MarshallableTypes
-    return [marshal(value, types=item_types) for value in data]
+    marshalled_data: list[abc.MarshallableTypes] = []
+    append: Callable[[abc.MarshallableTypes], None] = marshalled_data.append
+    values: Iterator[abc.MarshallableTypes] = iter(data)
+    model_type: type | None = None
+    # Leading items of a single model type are marshalled without
+    # dispatching each through `marshal`, until (if ever) an item of another
+    # type is encountered
+    for value in values:
+        if model_type is None:
+            if not isinstance(value, abc.Model):
+                append(marshal(value, types=item_types))
+                break
+            model_type = type(value)
+        elif type(value) is not model_type:
+            append(marshal(value, types=item_types))
+            break
+        append(value._marshal())  # type: ignore # noqa: SLF001
+    marshalled_data.extend(
+        marshal(value, types=item_types) for value in values
+    )
+    return marshalled_data
 
 
 def _marshal_mapping(
@@ -2030,8 +2138,9 @@ def _marshal_mapping(
     else:
         if not isinstance(data, Mapping):
             raise TypeError(data)
-        # This gives consistent sorting for non-ordered mappings
-        items = sorted(data.items(), key=lambda item: item[0])
+        # This gives consistent sorting for non-ordered mappings (sorting
+        # only the keys avoids calling a key function for each comparison)
+        items = [(key, data[key]) for key in sorted(data)]
     for key, value in items:
         marshalled_data[key] = marshal(value, types=value_types)
     return marshalled_data
@@ -2069,6 +2178,13 @@ def _marshal_typed(
     return marshalled_data
 
 
+# Types which can be serialized as JSON without modification (sub-classes
+# of these types are handled by `isinstance` checks)
+_JSON_SCALAR_TYPES: frozenset[type] = frozenset(
+    (str, int, float, bool, NoneType)
+)
+
+
 def marshal(  # noqa: C901
     data: abc.MarshallableTypes,
     types: Iterable[type | abc.Property] | abc.Types | None = None,
@@ -2093,7 +2209,11 @@ def marshal(  # noqa: C901
             so not typically provided explicitly by client applications.
     """
     marshalled_data: abc.JSONTypes
-    if isinstance(data, Decimal):
+    if type(data) in _JSON_SCALAR_TYPES:
+        # This is the most common case, so we check for it first (and
+        # without walking the MRO)
+        marshalled_data = cast("abc.JSONTypes", data)
+    elif isinstance(data, Decimal):
         # Instances of `decimal.Decimal` can'ts be serialized as JSON, so we
         # convert them to `float`
         marshalled_data = float(data)
@@ -2133,14 +2253,35 @@ def marshal(  # noqa: C901
 # region unmarshal
 
 
-def _is_non_string_iterable(value: abc.MarshallableTypes) -> bool:
-    return (
-        (not isinstance(value, (str, bytes)))
-        and (not isinstance(value, Mapping))
-        and isinstance(value, Iterable)
-    )
+@lru_cache(maxsize=256)
+def _type_accepts_parameter(type_: type, parameter_name: str) -> bool:
+    """
+    Determine whether a model class accepts a parameter (inspecting a
+    signature is slow, so the result is cached).
+    """
+    return parameter_name in signature(type_).parameters
+
+
+@lru_cache(maxsize=256)
+def _get_unmarshal_container_method(
+    data_type: type,
+) -> Callable[[_Unmarshal, type], abc.Model] | None:
+    """
+    Return the `_Unmarshal` method to use for un-marshalling data of the
+    specified type as a model, or `None` if data of this type is not a
+    container. The result is cached, since `_Unmarshal.as_type` needs this
+    for every candidate type.
+    """
+    if issubclass(data_type, (dict, abc.Object, abc.Dictionary, Mapping)):
+        return _Unmarshal.as_dictionary_type
+    if issubclass(data_type, Iterable) and not issubclass(
+        data_type, (str, bytes)
+    ):
+        return _Unmarshal.as_array_type
+    return None
 
 
+@lru_cache(maxsize=256)
 def _is_non_string_sequence_or_set_subclass(type_: type) -> bool:
     return (
         issubclass(type_, (collections.abc.Set, collections.abc.Sequence))
@@ -2197,7 +2338,7 @@ class _Unmarshal:
                 if self.meta is None:
                     # If the data provided is a `Generator`, make it static by
                     # casting the data into a tuple
-                    if isinstance(self.data, GeneratorType):
+                    if type(self.data) is GeneratorType:
                         self.data = tuple(self.data)
                     if not self.types:
                         # If no types are provided, we unmarshal the data into
@@ -2353,7 +2494,13 @@ class _Unmarshal:
         if hooks_:
             before_unmarshal_hook = hooks_.before_unmarshal
             if before_unmarshal_hook:
-                data = before_unmarshal_hook(deepcopy(data))
+                # Unless the hook is declared to leave its input unaltered,
+                # we pass it a copy of the data
+                data = before_unmarshal_hook(
+                    deepcopy(data)
+                    if getattr(hooks_, "before_unmarshal_mutates_data", True)
+                    else data
+                )
         return data
 
     @staticmethod
@@ -2373,7 +2520,7 @@ class _Unmarshal:
         if dictionary_type:
             type_ = dictionary_type
             data = self.before_hook(type_)
-            if "value_types" in signature(type_).parameters:
+            if _type_accepts_parameter(type_, "value_types"):
                 unmarshalled_data = type_(
                     data, value_types=self.value_types or None
                 )
@@ -2391,7 +2538,7 @@ class _Unmarshal:
             type_ = Array
         elif issubclass(type_, abc.Array):
             pass
-        elif _is_non_string_sequence_or_set_subclass(type_):
+        elif _is_non_string_sequence_or_set_subclass(cast("type", type_)):
             type_ = Array
         else:
             message: str = f"{self.data!r} is not of type `{type_!r}`"
@@ -2401,7 +2548,7 @@ class _Unmarshal:
     def as_array_type(self, type_: type) -> abc.Array:
         unmarshalled_data: abc.Array
         type_ = self.get_array_type(type_)
-        if "item_types" in signature(type_).parameters:
+        if _type_accepts_parameter(type_, "item_types"):
             unmarshalled_data = type_(
                 cast("abc.Array", self.data),
                 item_types=self.item_types or None,  # type: ignore
@@ -2418,18 +2565,12 @@ class _Unmarshal:
         if isinstance(type_, abc.Property):
             unmarshalled_data = _unmarshal_property_value(type_, self.data)
         elif isinstance(type_, type):
-            if isinstance(
-                self.data,
-                (
-                    dict,
-                    abc.Object,
-                    abc.Dictionary,
-                    Mapping,
-                ),
-            ):
-                unmarshalled_data = self.as_dictionary_type(type_)
-            elif _is_non_string_iterable(self.data):
-                unmarshalled_data = self.as_array_type(type_)
+            data_type: type = type(self.data)
+            as_container_type: (
+                Callable[[_Unmarshal, type], abc.Model] | None
+            ) = _get_unmarshal_container_method(data_type)
+            if as_container_type is not None:
+                unmarshalled_data = as_container_type(self, type_)
             elif isinstance(self.data, type_):
                 if isinstance(self.data, Decimal):
                     unmarshalled_data = float(self.data)
@@ -2489,19 +2630,13 @@ def unmarshal(
 # region serialize
 
 
-def _get_serialize_instance_hooks(
-    data: abc.Model,
-) -> tuple[
-    Callable[[abc.JSONTypes], abc.JSONTypes] | None,
-    Callable[[str], str] | None,
-]:
-    before_serialize: Callable[[abc.JSONTypes], abc.JSONTypes] | None = None
-    after_serialize: Callable[[str], str] | None = None
-    instance_hooks: abc.Hooks | None = hooks.read_model_hooks(data)
-    if instance_hooks is not None:
-        before_serialize = instance_hooks.before_serialize
-        after_serialize = instance_hooks.after_serialize
-    return before_serialize, after_serialize
+@lru_cache(maxsize=16)
+def _get_json_encoder(indent: int | None) -> json.JSONEncoder:
+    """
+    Return a (shared) JSON encoder for the specified indentation, so that
+    one is not constructed each time data is serialized.
+    """
+    return json.JSONEncoder(indent=indent)
 
 
 def serialize(
@@ -2519,19 +2654,21 @@ def serialize(
     """
     string_data: str
     if isinstance(data, abc.Model):
-        before_serialize: Callable[[abc.JSONTypes], abc.JSONTypes] | None
-        after_serialize: Callable[[str], str] | None
-        before_serialize, after_serialize = _get_serialize_instance_hooks(data)
+        # Hooks are read directly (rather than cached per class) because
+        # they may be defined per-instance, or modified at any time
+        instance_hooks: abc.Hooks | None = hooks.read_model_hooks(data)
         marshalled_data: abc.JSONTypes = marshal(data)
-        if before_serialize is not None:
-            marshalled_data = before_serialize(marshalled_data)
-        string_data = json.dumps(marshalled_data, indent=indent)
-        if after_serialize is not None:
-            string_data = after_serialize(string_data)
+        if instance_hooks is None:
+            return _get_json_encoder(indent).encode(marshalled_data)
+        if instance_hooks.before_serialize is not None:
+            marshalled_data = instance_hooks.before_serialize(marshalled_data)
+        string_data = _get_json_encoder(indent).encode(marshalled_data)
+        if instance_hooks.after_serialize is not None:
+            string_data = instance_hooks.after_serialize(string_data)
     else:
         if not isinstance(data, abc.JSON_TYPES):
             raise TypeError(data)
-        string_data = json.dumps(data, indent=indent)
+        string_data = _get_json_encoder(indent).encode(data)
     return string_data
 
 
@@ -2539,6 +2676,11 @@ def serialize(
 # region deserialize
 
 
+# Passing keyword arguments to `json.loads` causes a new decoder to be
+# created for each call, so we use a shared decoder instead
+_JSON_DECODER: json.JSONDecoder = json.JSONDecoder(strict=False)
+
+
 def deserialize(
     data: str | bytes | abc.Readable | None,
     coerce_unparseable: type[str | bytes] | None = None,
@@ -2561,10 +2703,7 @@ def deserialize(
     deserialized_data: abc.JSONTypes
     if isinstance(data, str):
         try:
-            deserialized_data = json.loads(
-                data,
-                strict=False,
-            )
+            deserialized_data = _JSON_DECODER.decode(data)
         except ValueError as error:
             if coerce_unparseable:
                 return data
@@ -2574,9 +2713,11 @@ def deserialize(
             ) from error
     elif isinstance(data, bytes):
         str_data: str = str(data, encoding="utf-8")
+        # The decoded data is parsed here directly, rather than by way of a
+        # recursive call, so that errors are only wrapped once
         try:
-            deserialized_data = deserialize(str_data)
-        except DeserializeError as error:
+            deserialized_data = _JSON_DECODER.decode(str_data)
+        except ValueError as error:
             if coerce_unparseable:
                 if issubclass(coerce_unparseable, bytes):
                     return data
@@ -2606,26 +2747,65 @@ def _default_validate_method(
     return ()
 
 
+@lru_cache(maxsize=1024)
+def _type_has_validate_method(type_: type) -> bool:
+    """
+    Return `True` if instances of a type have a `_validate` method. This is
+    cached, so that validating data which is not a model (strings, numbers,
+    etc.) does not incur a failed attribute look-up for each value.
+    """
+    return callable(getattr(type_, "_validate", None))
+
+
 def _call_validate_method(
     data: abc.Model,
 ) -> Iterable[str]:
+    if not _type_has_validate_method(type(data)):
+        return
     error_message: str
     error_messages: set[str] = set()
+    add_error_message: Callable[[str], None] = error_messages.add
     validate_method: Callable[..., Iterable[str]] = get_method(
         data, "_validate", _default_validate_method
     )  # type: ignore
     for error_message in validate_method(raise_errors=False):
-        if error_message not in error_messages:
-            yield error_message
-            error_messages.add(error_message)
+        if error_message in error_messages:
+            continue
+        add_error_message(error_message)
+        yield error_message
+
+
+def _represent_validation_error_messages(
+    data_representation: str, error_messages: Iterable[str]
+) -> str:
+    """
+    Combine validation error messages into the text of a validation error,
+    prefixed by the (indented) representation of the invalid data, if not
+    already present.
+    """
+    prefix: str = f"\n\n    {data_representation}"
+    error_messages_representation: str = "\n\n".join(error_messages)
+    if prefix not in error_messages_representation:
+        error_messages_representation = (
+            f"{prefix}\n\n{error_messages_representation}"
+        )
+    return error_messages_representation
 
 
 def _validate_typed(
     data: abc.Model | None,
     types: Iterable[type | abc.Property] | abc.Types,
-) -> list[str]:
+) -> tuple[list[str], str | None]:
+    """
+    Validate data against a set of types, returning any error messages along
+    with the (indented) representation of the data, if one was needed. The
+    representation is returned so that it can be re-used by the caller,
+    rather than walking the data again.
+    """
     error_messages: list[str] = []
     valid: bool = False
+    data_representation: str | None = None
+    property_error_messages: Sequence[str]
     for type_ in types:
         if isinstance(type_, type) and isinstance(data, type_):
             valid = True
@@ -2634,25 +2814,37 @@ def _validate_typed(
             if type_.types is None:
                 valid = True
                 break
-            try:
-                validate(data, type_.types, raise_errors=True)
+            # Collecting error messages, rather than raising and catching a
+            # validation error, avoids exception overhead for each failed
+            # type
+            property_error_messages = validate(
+                data, type_.types, raise_errors=False
+            )
+            if not property_error_messages:
                 valid = True
                 break
-            except errors.ValidationError:
-                error_messages.append(get_exception_text())
+            if data_representation is None:
+                data_representation = indent_(represent(data))
+            error_messages.append(
+                _represent_validation_error_messages(
+                    data_representation, property_error_messages
+                )
+            )
     if valid:
         error_messages.clear()
     else:
+        if data_representation is None:
+            data_representation = indent_(represent(data))
         types_bullet_list: str = "\n\n".join(
             indent_(represent(type_), 4) for type_ in (types or ())
         )
         error_messages.append(
             f"Invalid data:\n\n"
-            f"    {indent_(represent(data))}\n\n"
+            f"    {data_representation}\n\n"
             f"The data must be one of the following types:\n\n"
             f"    {types_bullet_list}"
         )
-    return error_messages
+    return error_messages, data_representation
 
 
 def validate(
@@ -2678,20 +2870,21 @@ def validate(
     in a validation error being raised. If `raise_errors` is `False`, a list
     of error messages will be returned.
     """
-    if isinstance(data, GeneratorType):
+    if type(data) is GeneratorType:
         data = tuple(data)
     error_messages: list[str] = []
+    data_representation: str | None = None
     if types is not None:
-        error_messages.extend(_validate_typed(data, types))
+        error_messages, data_representation = _validate_typed(data, types)
     error_messages.extend(_call_validate_method(data))
     if raise_errors and error_messages:
-        data_representation: str = f"\n\n    {indent_(represent(data))}"
-        error_messages_representation: str = "\n\n".join(error_messages)
-        if data_representation not in error_messages_representation:
-            error_messages_representation = (
-                f"{data_representation}\n\n{error_messages_representation}"
+        if data_representation is None:
+            data_representation = indent_(represent(data))
+        raise errors.ValidationError(
+            _represent_validation_error_messages(
+                data_representation, error_messages
             )
-        raise errors.ValidationError(error_messages_representation)
+        )
     return error_messages
 
 
@@ -2699,182 +2892,224 @@ def validate(
 # region _unmarshal_property_value
 
 
-class _UnmarshalProperty:
+def _validate_enumerated_property_value(
+    property_: abc.Property, value: abc.MarshallableTypes
+) -> None:
     """
-    This is exclusively for use by wrapper function
-    `_unmarshal_property_value`.
+    Verify that a value is one of the enumerated options
     """
+    if (
+        (value is not None)
+        and isinstance(property_, abc.EnumeratedProperty)
+        and (property_.values is not None)
+        and (value not in property_.values)
+    ):
+        message: str = (
+            "The value provided is not a valid option:\n{}\n\n"
+            "Valid options include:\n{}".format(
+                represent(value),
+                ", ".join(
+                    represent(enumerated_value)
+                    for enumerated_value in property_.values
+                ),
+            )
+        )
+        raise UnmarshalValueError(message, data=value)
 
-    def __init__(self, property_: abc.Property) -> None:
-        self.property = property_
 
-    def validate_enumerated(self, value: abc.MarshallableTypes) -> None:
-        """
-        Verify that a value is one of the enumerated options
-        """
-        if (
-            (value is not None)
-            and isinstance(self.property, abc.EnumeratedProperty)
-            and (self.property.values is not None)
-            and (value not in self.property.values)
-        ):
-            message: str = (
-                "The value provided is not a valid option:\n{}\n\n"
-                "Valid options include:\n{}".format(
-                    represent(value),
-                    ", ".join(
-                        represent(enumerated_value)
-                        for enumerated_value in self.property.values
-                    ),
-                )
-            )
-            raise UnmarshalValueError(message, data=value)
+def _unmarshal_enumerated_property_value(
+    property_: abc.Property, value: abc.MarshallableTypes
+) -> abc.MarshallableTypes:
+    """
+    Verify that a value is one of the enumerated options
+    """
+    unmarshalled_value: abc.MarshallableTypes = value
+    _validate_enumerated_property_value(property_, value)
+    if property_.types is not None:
+        unmarshalled_value = unmarshal(value, types=property_.types)
+    return unmarshalled_value
 
-    def unmarshal_enumerated(
-        self, value: abc.MarshallableTypes
-    ) -> abc.MarshallableTypes:
-        """
-        Verify that a value is one of the enumerated options
-        """
-        unmarshalled_value: abc.MarshallableTypes = value
-        self.validate_enumerated(value)
-        if self.property.types is not None:
-            unmarshalled_value = unmarshal(value, types=self.property.types)
-        return unmarshalled_value
 
-    def parse_date(self, value: str | None) -> date | None:
-        if value is None:
-            return value
-        if not isinstance(value, (date, str)):
-            raise TypeError(value)
-        if isinstance(value, date):
-            date_instance = value
-        else:
-            if not isinstance(self.property, abc.DateProperty):
-                raise TypeError(self.property)
-            date_instance = self.property.str2date(value)
-        if not isinstance(date_instance, date):
-            raise TypeError(date_instance)
-        return date_instance
-
-    def parse_datetime(self, value: str | datetime | None) -> datetime | None:
-        datetime_instance: datetime | None = None
-        if value is not None:
-            if not isinstance(value, (datetime, str)):
-                raise TypeError(value)
-            if isinstance(value, datetime):
-                datetime_instance = value
-            else:
-                if not isinstance(self.property, abc.DateTimeProperty):
-                    raise TypeError(self.property)
-                datetime_instance = self.property.str2datetime(value)
-            if not isinstance(datetime_instance, datetime):
-                raise TypeError(datetime_instance)
-        return datetime_instance
+def _unmarshal_date_property_value(
+    property_: abc.Property, value: str | None
+) -> date | None:
+    if (value is None) or isinstance(value, date):
+        return value
+    if not isinstance(value, str):
+        raise TypeError(value)
+    if not isinstance(property_, abc.DateProperty):
+        raise TypeError(property_)
+    date_instance: date = property_.str2date(value)
+    # Only the result of a (potentially user-defined) `str2date` function
+    # needs to be verified
+    if not isinstance(date_instance, date):
+        raise TypeError(date_instance)
+    return date_instance
+
+
+def _unmarshal_datetime_property_value(
+    property_: abc.Property, value: str | datetime | None
+) -> datetime | None:
+    if (value is None) or isinstance(value, datetime):
+        return value
+    if not isinstance(value, str):
+        raise TypeError(value)
+    if not isinstance(property_, abc.DateTimeProperty):
+        raise TypeError(property_)
+    datetime_instance: datetime = property_.str2datetime(value)
+    if not isinstance(datetime_instance, datetime):
+        raise TypeError(datetime_instance)
+    return datetime_instance
 
-    @staticmethod
-    def parse_bytes(data: str | bytes) -> bytes | None:
-        """
-        Un-marshal a base-64 encoded string into bytes
-        """
-        unmarshalled_data: bytes | None
-        if data is None:
-            unmarshalled_data = data
-        elif isinstance(data, str):
-            unmarshalled_data = b64decode(data)
-        elif isinstance(data, bytes):
-            unmarshalled_data = data
-        else:
-            msg = (
-                "`data` must be a base64 encoded `str` or `bytes`--not "
-                f"`{get_qualified_name(type(data))}`"
-            )
-            raise TypeError(msg)
-        return unmarshalled_data
 
-    def unmarshall_array(
-        self, value: abc.MarshallableTypes
-    ) -> abc.MarshallableTypes:
-        if not isinstance(self.property, abc.ArrayProperty):
-            raise TypeError(self.property)
-        return unmarshal(
-            value,
-            types=self.property.types or (),
-            item_types=self.property.item_types or (),
-        )
+# Base-64 encoded strings up to this length are decoded using a cache, since
+# the same values (icons, keys, etc.) are often repeated across records. The
+# length and cache size together bound the memory retained by the cache to
+# roughly 128 * (1024 + 768) bytes (the encoded keys plus decoded values).
+_B64DECODE_CACHED_MAX_LENGTH: int = 1024
 
-    def unmarshall_dictionary(
-        self, value: abc.MarshallableTypes
-    ) -> abc.MarshallableTypes:
-        if not isinstance(self.property, abc.DictionaryProperty):
-            raise TypeError(self.property)
-        return unmarshal(
-            value,
-            types=self.property.types or (),
-            value_types=self.property.value_types or (),
-        )
 
-    def represent_function_call(self, value: abc.MarshallableTypes) -> str:
-        return (
-            "sob.model._unmarshal_property_value(\n"
-            f"    {indent_(utilities.represent(self.property))},\n"
-            f"    {indent_(utilities.represent(value))}\n"
-            ")"
+@lru_cache(maxsize=128)
+def _b64decode_cached(data: str) -> bytes:
+    return b64decode(data)
+
+
+def _unmarshal_bytes_property_value(
+    property_: abc.Property,  # noqa: ARG001
+    data: str | bytes,
+) -> bytes | None:
+    """
+    Un-marshal a base-64 encoded string into bytes
+    """
+    unmarshalled_data: bytes | None
+    if data is None:
+        unmarshalled_data = data
+    elif isinstance(data, str):
+        unmarshalled_data = (
+            _b64decode_cached(data)
+            if len(data) <= _B64DECODE_CACHED_MAX_LENGTH
+            else b64decode(data)
+        )
+    elif isinstance(data, bytes):
+        unmarshalled_data = data
+    else:
+        msg = (
+            "`data` must be a base64 encoded `str` or `bytes`--not "
+            f"`{_get_type_qualified_name(type(data))}`"
         )
+        raise TypeError(msg)
+    return unmarshalled_data
 
-    def _call(self, value: abc.MarshallableTypes) -> abc.MarshallableTypes:
-        type_: type
-        matched: bool = False
-        unmarshalled_value: abc.MarshallableTypes = value
-        method: Callable[..., abc.MarshallableTypes]
-        for type_, method in (
-            (abc.DateProperty, self.parse_date),
-            (abc.DateTimeProperty, self.parse_datetime),
-            (abc.BytesProperty, self.parse_bytes),
-            (abc.ArrayProperty, self.unmarshall_array),
-            (abc.DictionaryProperty, self.unmarshall_dictionary),
-            (abc.EnumeratedProperty, self.unmarshal_enumerated),
-        ):
-            if isinstance(self.property, type_):
-                matched = True
-                unmarshalled_value = method(value)  # type: ignore
-                break
-        if not matched:
-            if (
-                isinstance(value, Iterable)
-                and not isinstance(value, (str, bytes, bytearray))
-                and not isinstance(value, abc.Model)
+
+def _unmarshal_array_property_value(
+    property_: abc.Property, value: abc.MarshallableTypes
+) -> abc.MarshallableTypes:
+    if not isinstance(property_, abc.ArrayProperty):
+        raise TypeError(property_)
+    return unmarshal(
+        value,
+        types=property_.types or (),
+        item_types=property_.item_types or (),
+    )
+
+
+def _unmarshal_dictionary_property_value(
+    property_: abc.Property, value: abc.MarshallableTypes
+) -> abc.MarshallableTypes:
+    if not isinstance(property_, abc.DictionaryProperty):
+        raise TypeError(property_)
+    return unmarshal(
+        value,
+        types=property_.types or (),
+        value_types=property_.value_types or (),
+    )
+
+
+def _unmarshal_other_property_value(
+    property_: abc.Property, value: abc.MarshallableTypes
+) -> abc.MarshallableTypes:
+    """
+    Un-marshal a value for a property not requiring specialized handling
+    """
+    unmarshalled_value: abc.MarshallableTypes = value
+    if (
+        isinstance(value, Iterable)
+        and not isinstance(value, (str, bytes, bytearray))
+        and not isinstance(value, abc.Model)
+    ):
+        if isinstance(value, (Mapping, abc.Dictionary)):
+            if not isinstance(value, (MutableMapping, abc.Dictionary)):
+                raise TypeError(value)
+            # When the property has types, un-marshalling will produce a new
+            # object, so the mapping only needs copying if it has `None`
+            # values to replace
+            if (not property_.types) or any(
+                item_value is None for item_value in value.values()
             ):
-                if isinstance(value, (Mapping, abc.Dictionary)):
-                    if not isinstance(value, (MutableMapping, abc.Dictionary)):
-                        raise TypeError(value)
+                if type(value) is dict:
+                    unmarshalled_value = {
+                        key: (NULL if item_value is None else item_value)
+                        for key, item_value in value.items()
+                    }
+                else:
                     unmarshalled_value = copy(value)
                     for key, item_value in value.items():
                         if item_value is None:
                             unmarshalled_value[key] = NULL
-                else:
-                    unmarshalled_value = tuple(
-                        (NULL if item_value is None else item_value)
-                        for item_value in value
-                    )
-            if self.property.types:
-                unmarshalled_value = unmarshal(
-                    unmarshalled_value, types=self.property.types
-                )
-        return unmarshalled_value
-
-    def __call__(self, value: abc.MarshallableTypes) -> abc.MarshallableTypes:
-        try:
-            return self._call(value)
-        except Exception as error:
-            append_exception_text(
-                error,
-                (
-                    "\nAn error was encountered during execution of:\n"
-                    f"{self.represent_function_call(value)}"
-                ),
+        elif not (
+            type(value) is tuple
+            and not any(item_value is None for item_value in value)
+        ):
+            unmarshalled_value = tuple(
+                (NULL if item_value is None else item_value)
+                for item_value in value
             )
-            raise
+    if property_.types:
+        unmarshalled_value = unmarshal(
+            unmarshalled_value, types=property_.types
+        )
+    return unmarshalled_value
+
+
+# Property types requiring specialized un-marshalling, mapped to the function
+# handling each, in order of precedence
+_UNMARSHAL_PROPERTY_VALUE_FUNCTIONS: tuple[
+    tuple[type, Callable[[abc.Property, Any], abc.MarshallableTypes]], ...
+] = (
+    (abc.DateProperty, _unmarshal_date_property_value),
+    (abc.DateTimeProperty, _unmarshal_datetime_property_value),
+    (abc.BytesProperty, _unmarshal_bytes_property_value),
+    (abc.ArrayProperty, _unmarshal_array_property_value),
+    (abc.DictionaryProperty, _unmarshal_dictionary_property_value),
+    (abc.EnumeratedProperty, _unmarshal_enumerated_property_value),
+)
+
+
+@lru_cache(maxsize=256)
+def _get_unmarshal_property_value_function(
+    property_type: type,
+) -> Callable[[abc.Property, Any], abc.MarshallableTypes]:
+    """
+    Get the function to use for un-marshalling values of a property class.
+    This is cached, so that each property class is only matched once.
+    """
+    type_: type
+    function: Callable[[abc.Property, Any], abc.MarshallableTypes]
+    for type_, function in _UNMARSHAL_PROPERTY_VALUE_FUNCTIONS:
+        if issubclass(property_type, type_):
+            return function
+    return _unmarshal_other_property_value
+
+
+def _represent_unmarshal_property_value_call(
+    property_: abc.Property, value: abc.MarshallableTypes
+) -> str:
+    return (
+        "sob.model._unmarshal_property_value(\n"
+        f"    {indent_(utilities.represent(property_))},\n"
+        f"    {indent_(utilities.represent(value))}\n"
+        ")"
+    )
 
 
 def _unmarshal_property_value(
@@ -2883,94 +3118,135 @@ def _unmarshal_property_value(
     """
     Un-marshal a property value
     """
-    return _UnmarshalProperty(property_)(value)
+    try:
+        return _get_unmarshal_property_value_function(type(property_))(
+            property_, value
+        )
+    except Exception as error:
+        append_exception_text(
+            error,
+            (
+                "\nAn error was encountered during execution of:\n"
+                f"{_represent_unmarshal_property_value_call(property_, value)}"
+            ),
+        )
+        raise
 
 
 # endregion
 # region _marshal_property_value
 
 
-class _MarshalProperty:
+def _marshal_date_property_value(property_: abc.Property, value: date) -> str:
+    if not isinstance(value, date):
+        raise TypeError(value)
+    if not isinstance(property_, abc.DateProperty):
+        raise TypeError(property_)
+    date_string: str = property_.date2str(value)
+    if not isinstance(date_string, str):
+        message: str = (
+            "The date2str function should return a `str`, not a "
+            f"`{type(date_string).__name__}`: "
+            f"{represent(date_string)}"
+        )
+        raise TypeError(message)
+    return date_string
+
+
+def _marshal_datetime_property_value(
+    property_: abc.Property, value: datetime
+) -> str:
+    if not isinstance(value, datetime):
+        raise TypeError(value)
+    if not isinstance(property_, abc.DateTimeProperty):
+        raise TypeError(property_)
+    datetime_string: str = property_.datetime2str(value)
+    if not isinstance(datetime_string, str):
+        msg = (
+            "The datetime2str function should return a `str`, not a "
+            f"`{type(datetime_string).__name__}`: "
+            f"{represent(datetime_string)}"
+        )
+        raise TypeError(msg)
+    return datetime_string
+
+
+def _marshal_bytes_property_value(
+    property_: abc.Property,  # noqa: ARG001
+    value: bytes,
+) -> str:
     """
-    This is exclusively for use by wrapper function `_marshal_property_value`.
+    Marshal bytes into a base-64 encoded string
     """
+    if not isinstance(value, bytes):
+        raise TypeError(value)
+    return str(b64encode(value), "ascii")
 
-    def __init__(self, property_: abc.Property) -> None:
-        self.property = property_
 
-    def parse_date(self, value: date | None) -> str | None:
-        date_string: str | None = None
-        if value is not None:
-            if not isinstance(self.property, abc.DateProperty):
-                raise TypeError(self.property)
-            date_string = self.property.date2str(value)
-            if not isinstance(date_string, str):
-                message: str = (
-                    "The date2str function should return a `str`, not a "
-                    f"`{type(date_string).__name__}`: "
-                    f"{represent(date_string)}"
-                )
-                raise TypeError(message)
-        return date_string
+def _marshal_array_property_value(
+    property_: abc.Property, value: abc.MarshallableTypes
+) -> abc.JSONTypes:
+    if not isinstance(property_, abc.ArrayProperty):
+        raise TypeError(property_)
+    return marshal(
+        value,
+        types=property_.types,
+        item_types=property_.item_types,
+    )
 
-    def parse_datetime(self, value: datetime | None) -> str | None:
-        datetime_string: str | None = None
-        if value is not None:
-            if not isinstance(self.property, abc.DateTimeProperty):
-                raise TypeError(self.property)
-            datetime_string = self.property.datetime2str(value)
-            if not isinstance(datetime_string, str):
-                msg = (
-                    "The datetime2str function should return a `str`, not a "
-                    f"`{type(datetime_string).__name__}`: "
-                    f"{represent(datetime_string)}"
-                )
-                raise TypeError(msg)
-        return datetime_string
 
-    def parse_bytes(self, value: bytes) -> str:
-        """
-        Marshal bytes into a base-64 encoded string
-        """
-        if (value is None) or isinstance(value, str):
-            return value
-        if isinstance(value, bytes):
-            return str(b64encode(value), "ascii")
-        message: str = (
-            f"`data` must be a base64 encoded `str` or `bytes`--not "
-            f"`{get_qualified_name(type(value))}`"
-        )
-        raise TypeError(message)
+def _marshal_dictionary_property_value(
+    property_: abc.Property, value: abc.MarshallableTypes
+) -> abc.JSONTypes:
+    if not isinstance(property_, abc.DictionaryProperty):
+        raise TypeError(property_)
+    return marshal(
+        value,
+        types=property_.types,
+        value_types=property_.value_types,
+    )
+
+
+def _marshal_other_property_value(
+    property_: abc.Property, value: abc.MarshallableTypes
+) -> abc.JSONTypes:
+    """
+    Marshal a value for a property not requiring specialized handling
+    """
+    if type(value) in _JSON_SCALAR_TYPES:
+        # Strings, numbers, and booleans are passed through as-is, without
+        # needing to consider the property's types
+        return cast("abc.JSONTypes", value)
+    return marshal(value, types=property_.types)
+
+
+# Property types requiring specialized marshalling, mapped to the function
+# handling each, in order of precedence
+_MARSHAL_PROPERTY_VALUE_FUNCTIONS: tuple[
+    tuple[type, Callable[[abc.Property, Any], abc.JSONTypes]], ...
+] = (
+    (abc.DateProperty, _marshal_date_property_value),
+    (abc.DateTimeProperty, _marshal_datetime_property_value),
+    (abc.BytesProperty, _marshal_bytes_property_value),
+    (abc.ArrayProperty, _marshal_array_property_value),
+    (abc.DictionaryProperty, _marshal_dictionary_property_value),
+)
 
-    def __call__(self, value: abc.MarshallableTypes) -> Any:
-        if value is not None:
-            if isinstance(self.property, abc.DateProperty):
-                if not isinstance(value, date):
-                    raise TypeError(value)
-                value = self.parse_date(value)
-            elif isinstance(self.property, abc.DateTimeProperty):
-                if not isinstance(value, datetime):
-                    raise TypeError(value)
-                value = self.parse_datetime(value)
-            elif isinstance(self.property, abc.BytesProperty):
-                if not isinstance(value, bytes):
-                    raise TypeError(value)
-                value = self.parse_bytes(value)
-            elif isinstance(self.property, abc.ArrayProperty):
-                value = marshal(
-                    value,
-                    types=self.property.types,
-                    item_types=self.property.item_types,
-                )
-            elif isinstance(self.property, abc.DictionaryProperty):
-                value = marshal(
-                    value,
-                    types=self.property.types,
-                    value_types=self.property.value_types,
-                )
-            else:
-                value = marshal(value, types=self.property.types)
-        return value
+
+@lru_cache(maxsize=256)
+def _get_marshal_property_value_function(
+    property_type: type,
+) -> Callable[[abc.Property, Any], abc.JSONTypes]:
+    """
+    Get the function to use for marshalling values of a property class.
+    This is cached, so that each property class is only matched once.
+    """
+    type_: type
+    function: Callable[[abc.Property, Any], abc.JSONTypes]
+    for type_, function in _MARSHAL_PROPERTY_VALUE_FUNCTIONS:
+        if issubclass(property_type, type_):
+            return function
+    return _marshal_other_property_value
 
 
 def _marshal_property_value(
@@ -2979,7 +3255,11 @@ def _marshal_property_value(
     """
     Marshal a property value
     """
-    return _MarshalProperty(property_)(value)
+    if value is None:
+        return value
+    return _get_marshal_property_value_function(type(property_))(
+        property_, value
+    )
 
 
 # endregion
@@ -2992,9 +3272,16 @@ def _replace_object_nulls(
 ) -> None:
     property_name_: str
     value: abc.MarshallableTypes
-    for property_name_, value in utilities.iter_properties_values(
+    # Property names are read from the object's metadata, rather than
+    # by inspecting all of the object's attributes with `dir`
+    instance_meta: abc.ObjectMeta | None = meta.read_object_meta(
         object_instance
-    ):
+    )
+    if not (instance_meta and instance_meta.properties):
+        return
+    for property_name_ in instance_meta.properties:
+        # Un-assigned properties are treated as `None`
+        value = getattr(object_instance, property_name_, None)
         if value is NULL:
             setattr(object_instance, property_name_, replacement_value)
         elif isinstance(value, abc.Model):
@@ -3007,11 +3294,17 @@ def _replace_array_nulls(
 ) -> None:
     index: int
     value: abc.MarshallableTypes
+    # Null indices are collected in a single pass, so that items are only
+    # set (and un-marshalled) where a replacement is needed
+    null_indices: list[int] = []
+    append_null_index: Callable[[int], None] = null_indices.append
     for index, value in enumerate(array_instance):
         if value is NULL:
-            array_instance[index] = replacement_value
+            append_null_index(index)
         elif isinstance(value, abc.Model):
             replace_model_nulls(value, replacement_value)
+    for index in null_indices:
+        array_instance[index] = replacement_value
 
 
 def _replace_dictionary_nulls(
@@ -3020,11 +3313,43 @@ def _replace_dictionary_nulls(
 ) -> None:
     key: str
     value: abc.MarshallableTypes
+    null_keys: list[str] = []
+    append_null_key: Callable[[str], None] = null_keys.append
     for key, value in dictionary_instance.items():
         if value is NULL:
-            dictionary_instance[key] = replacement_value
+            append_null_key(key)
         elif isinstance(value, abc.Model):
             replace_model_nulls(value, replacement_value)
+    for key in null_keys:
+        dictionary_instance[key] = replacement_value
+
+
+# Model types mapped to the function used to replace their nulls, in order of
+# precedence
+_REPLACE_MODEL_NULLS_FUNCTIONS: tuple[
+    tuple[type, Callable[[Any, abc.MarshallableTypes], None]], ...
+] = (
+    (abc.Object, _replace_object_nulls),
+    (abc.Array, _replace_array_nulls),
+    (abc.Dictionary, _replace_dictionary_nulls),
+)
+
+
+@lru_cache(maxsize=1024)
+def _get_replace_model_nulls_function(
+    model_type: type,
+) -> Callable[[Any, abc.MarshallableTypes], None] | None:
+    """
+    Get the function used to replace nulls for a model class (or `None`, if
+    the class is not an object, array, or dictionary). This is cached, so
+    that each class is only matched once.
+    """
+    type_: type
+    function: Callable[[Any, abc.MarshallableTypes], None]
+    for type_, function in _REPLACE_MODEL_NULLS_FUNCTIONS:
+        if issubclass(model_type, type_):
+            return function
+    return None
 
 
 def replace_model_nulls(
@@ -3040,12 +3365,11 @@ def replace_model_nulls(
     - replacement_value (typing.Any):
       The value with which nulls will be replaced. This defaults to `None`.
     """
-    if isinstance(model_instance, abc.Object):
-        _replace_object_nulls(model_instance, replacement_value)
-    elif isinstance(model_instance, abc.Array):
-        _replace_array_nulls(model_instance, replacement_value)
-    elif isinstance(model_instance, abc.Dictionary):
-        _replace_dictionary_nulls(model_instance, replacement_value)
+    replace_nulls: Callable[[Any, abc.MarshallableTypes], None] | None = (
+        _get_replace_model_nulls_function(type(model_instance))
+    )
+    if replace_nulls is not None:
+        replace_nulls(model_instance, replacement_value)
 
 
 replace_nulls = deprecated(
@@ -3059,41 +3383,71 @@ replace_nulls = deprecated(
 
 
 def _type_hint_from_property_types(
-    property_types: abc.Types | None, module: str
+    property_types: abc.Types | None,
+    module: str,
+    type_hints: dict[int, str] | None = None,
 ) -> str:
     type_hint: str = "sob.abc.MarshallableTypes | None"
     if property_types is not None:
         if len(property_types) > 1:
-            property_type_hints: tuple[str, ...] = tuple(
+            # Repeated types/properties are dropped (by identity, since
+            # properties may not be hashable) before their type hints are
+            # generated, then duplicate type hints are dropped, preserving
+            # their order
+            type_hint = "\n| ".join(
                 dict.fromkeys(
-                    _type_hint_from_property(item_type, module)
-                    for item_type in property_types
-                ).keys()
-            )
-            property_type_hint: str
-            type_hint = "\n".join(
-                (
-                    property_type_hints[0],
-                    *(
-                        f"| {property_type_hint}"
-                        for property_type_hint in property_type_hints[1:]
-                    ),
+                    _type_hint_from_property(item_type, module, type_hints)
+                    for item_type in {
+                        id(item_type): item_type
+                        for item_type in property_types
+                    }.values()
                 )
             )
         else:
-            type_hint = _type_hint_from_property(property_types[0], module)
+            type_hint = _type_hint_from_property(
+                property_types[0], module, type_hints
+            )
     return type_hint
 
 
 def _type_hint_from_property(
-    property_or_type: abc.Property | type, module: str
+    property_or_type: abc.Property | type,
+    module: str,
+    type_hints: dict[int, str] | None = None,
 ) -> str:
+    """
+    Get a type hint for a property or type. If provided, `type_hints` is used
+    to cache type hints by property/type ID, so that properties re-used
+    throughout a class definition are only walked once. This cache must not
+    outlive the properties referenced.
+    """
+    if type_hints is None:
+        return _get_property_type_hint(property_or_type, module, type_hints)
+    property_id: int = id(property_or_type)
+    type_hint: str | None = type_hints.get(property_id)
+    if type_hint is None:
+        type_hint = _get_property_type_hint(
+            property_or_type, module, type_hints
+        )
+        type_hints[property_id] = type_hint
+    return type_hint
+
+
+def _get_property_type_hint(
+    property_or_type: abc.Property | type,
+    module: str,
+    type_hints: dict[int, str] | None = None,
+) -> str:
+    """
+    Get a type hint for a property or type, without reading from the
+    `type_hints` cache (which is passed along for nested properties/types).
+    """
     type_hint: str
     if isinstance(property_or_type, type):
-        type_hint = get_qualified_name(property_or_type)
+        type_hint = _get_type_qualified_name(property_or_type)
     elif isinstance(property_or_type, abc.ArrayProperty):
         item_type_hint: str = _type_hint_from_property_types(
-            property_or_type.item_types, module
+            property_or_type.item_types, module, type_hints
         )
         if item_type_hint:
             if item_type_hint[0] == "(":
@@ -3109,7 +3463,7 @@ def _type_hint_from_property(
             type_hint = "typing.Sequence"
     elif isinstance(property_or_type, abc.DictionaryProperty):
         value_type_hint: str = _type_hint_from_property_types(
-            property_or_type.value_types, module
+            property_or_type.value_types, module, type_hints
         )
         if value_type_hint:
             if value_type_hint[0] == "(":
@@ -3127,7 +3481,7 @@ def _type_hint_from_property(
         )
     elif property_or_type and property_or_type.types:
         type_hint = _type_hint_from_property_types(
-            property_or_type.types, module
+            property_or_type.types, module, type_hints
         )
     else:
         type_hint = "typing.Any"
@@ -3175,23 +3529,33 @@ def _repr_class_docstring(docstring: str = "") -> str:
 def _model_class_from_meta(
     metadata: abc.Meta,
 ) -> type[Array | Dictionary | Object]:
-    return (
-        Object
-        if isinstance(metadata, abc.ObjectMeta)
-        else Array
-        if isinstance(metadata, abc.ArrayMeta)
-        else Dictionary
+    meta_type_names: tuple[str, str] | None = _get_meta_type_names(
+        type(metadata)
     )
+    if meta_type_names is None:
+        return Dictionary
+    return _MODEL_TYPE_NAMES_CLASSES[meta_type_names[0]]
+
+
+_MODEL_TYPE_NAMES_CLASSES: dict[str, type[Array | Dictionary | Object]] = {
+    "object": Object,
+    "array": Array,
+    "dictionary": Dictionary,
+}
 
 
 _REPR_MARSHALLABLE_TYPING: str = "sob.abc.MarshallableTypes"
 
 
-def _repr_class_init_from_meta(metadata: abc.Meta, module: str) -> str:
+def _repr_class_init_from_meta(
+    metadata: abc.Meta,
+    module: str,
+    type_hints: dict[int, str] | None = None,
+) -> str:
     out: list[str] = []
     if isinstance(metadata, abc.DictionaryMeta):
         repr_value_typing: str = _type_hint_from_property_types(
-            metadata.value_types, module
+            metadata.value_types, module, type_hints
         )
         mapping_repr_value_typing: str = indent_(repr_value_typing, 16)
         iterable_repr_value_typing: str = indent_(repr_value_typing, 20)
@@ -3221,7 +3585,10 @@ def _repr_class_init_from_meta(metadata: abc.Meta, module: str) -> str:
         )
     elif isinstance(metadata, abc.ArrayMeta):
         repr_item_typing: str = indent_(
-            _type_hint_from_property_types(metadata.item_types, module), 16
+            _type_hint_from_property_types(
+                metadata.item_types, module, type_hints
+            ),
+            16,
         )
         out.append(
             "\n"
@@ -3263,28 +3630,15 @@ def _repr_class_init_from_meta(metadata: abc.Meta, module: str) -> str:
             "            | None\n"
             "        ) = None,"
         )
+        property_parameters: list[str] = []
         property_assignments: list[str] = []
-        metadata_properties_items: tuple[tuple[str, abc.Property], ...] = (
-            ()
-            if metadata.properties is None
-            else tuple(metadata.properties.items())
-        )
-        metadata_properties_items_length: int = len(metadata_properties_items)
-        property_index: int
-        name_and_property: tuple[str, abc.Property]
-        for property_index, name_and_property in enumerate(
-            metadata_properties_items
+        property_name_: str
+        property_: abc.Property
+        for property_name_, property_ in (
+            () if metadata.properties is None else metadata.properties.items()
         ):
-            property_name_: str
-            property_: abc.Property
-            property_name_, property_ = name_and_property
-            repr_comma: str = (
-                ""
-                if (property_index + 1 == metadata_properties_items_length)
-                else ","
-            )
             repr_property_typing: str = indent_(
-                _type_hint_from_property(property_, module), 12
+                _type_hint_from_property(property_, module, type_hints), 12
             )
             property_assignments.append(
                 f"        self.{property_name_}: (\n"
@@ -3292,12 +3646,16 @@ def _repr_class_init_from_meta(metadata: abc.Meta, module: str) -> str:
                 "            | None\n"
                 f"        ) = {property_name_}"
             )
-            out.append(
+            property_parameters.append(
                 f"        {property_name_}: (\n"
                 f"            {repr_property_typing}\n"
                 "            | None\n"
-                f"        ) = None{repr_comma}"
+                "        ) = None"
             )
+        # Parameters are comma-separated in a single join, rather than
+        # determining whether each is the last as they are generated
+        if property_parameters:
+            out.append(",\n".join(property_parameters))
         out.append("    ) -> None:")
         out.extend(property_assignments)
         out.append("        super().__init__(_data)\n\n")
@@ -3345,12 +3703,62 @@ def _class_definition_from_meta(
         out.extend(_iter_represent_object_metadata_slots(metadata))
     if pre_init_source:
         out.append(f"\n{utilities.indent(pre_init_source, start=0)}")
-    out.append(_repr_class_init_from_meta(metadata, module))
+    # Type hints are cached for the duration of this function, so that
+    # properties re-used throughout the class definition are only walked once
+    out.append(_repr_class_init_from_meta(metadata, module, {}))
     if post_init_source:
         out.append(f"\n{utilities.indent(post_init_source, start=0)}")
     return "\n".join(out)
 
 
+@lru_cache(maxsize=32)
+def _compile_model_source(source: str, name: str) -> CodeType:
+    """
+    Compile generated model source code. This is cached, so that generating
+    a model from identical metadata (as when re-loading a schema) does not
+    re-parse the source. Because the cache retains each model's full source,
+    it is kept small.
+
+    The source is compiled with a descriptive file name, so that tracebacks
+    identify the generated model. The optimization level is left to match the
+    interpreter's, so that class docstrings are retained unless running with
+    `-OO`.
+    """
+    return compile(
+        source,
+        f"<sob.model.get_model_from_meta {name}>",
+        "exec",
+        dont_inherit=True,
+    )
+
+
+# These patterns are used to determine which modules need to be imported
+# by generated model source code. Each is only searched for after a (faster)
+# substring check, since the word boundaries are needed to avoid matching
+# property names such as "created_datetime".
+_DECIMAL_RE: Pattern = re.compile(r"\bdecimal\.Decimal\b")
+_DATETIME_RE: Pattern = re.compile(r"\bdatetime\b")
+
+
+# Import blocks for generated model source, indexed by
+# `(references decimal.Decimal) << 1 | (references datetime)`
+_IMPORTS_SOURCES: tuple[str, str, str, str] = (
+    "from __future__ import annotations\nimport typing\nimport sob",
+    (
+        "from __future__ import annotations\nimport typing\n"
+        "import datetime\nimport sob"
+    ),
+    (
+        "from __future__ import annotations\nimport typing\n"
+        "import decimal\nimport sob"
+    ),
+    (
+        "from __future__ import annotations\nimport typing\n"
+        "import decimal\nimport datetime\nimport sob"
+    ),
+)
+
+
 def get_model_from_meta(
     name: str,
     metadata: abc.Meta,
@@ -3381,34 +3789,21 @@ def get_model_from_meta(
     """
     # For pickling to work, the __module__ variable needs to be set...
     module = module or get_calling_module_name(2)
-    class_definition: str = _class_definition_from_meta(
+    imports_source: str
+    class_source: str
+    imports_source, class_source = _get_model_imports_and_class_source(
         name,
         metadata,
-        docstring=docstring,
         module=module,
+        docstring=docstring,
         pre_init_source=pre_init_source,
         post_init_source=post_init_source,
     )
     namespace: dict[str, Any] = {"__name__": f"from_meta_{name}"}
-    imports = [
-        "from __future__ import annotations",
-        "import typing",
-    ]
-    # `decimal.Decimal` may or may not be referenced in a given model--so
-    # check first
-    if re.search(r"\bdecimal\.Decimal\b", class_definition):
-        imports.append("import decimal")
-    # `datetime` may or may not be referenced in a given model--so check
-    # first
-    if re.search(r"\bdatetime\b", class_definition):
-        imports.append("import datetime")
-    imports.append("import sob")
-    source: str = suffix_long_lines(
-        "{}\n\n\n{}".format("\n".join(imports), class_definition)
-    )
+    source: str = f"{imports_source}\n\n\n{class_source}"
     error: Exception
     try:
-        exec(source, namespace)  # noqa: S102
+        exec(_compile_model_source(source, name), namespace)  # noqa: S102
     except Exception as error:
         append_exception_text(error, f"\n\n{source}")
         raise
@@ -3419,6 +3814,163 @@ def get_model_from_meta(
     return model_class
 
 
+def get_models_from_meta(
+    names_metadata: Iterable[tuple[str, abc.Meta]],
+    module: str | None = None,
+    docstrings: Mapping[str, str] | None = None,
+    pre_init_sources: Mapping[str, str] | None = None,
+    post_init_sources: Mapping[str, str] | None = None,
+) -> tuple[type[abc.Model], ...]:
+    """
+    Constructs a series of `sob.Object`, `sob.Array`, and/or `sob.Dictionary`
+    sub-classes from instances of `sob.ObjectMeta`, `sob.ArrayMeta`, or
+    `sob.DictionaryMeta`. The result is equivalent to calling
+    `get_model_from_meta` for each class, but the classes are compiled and
+    executed together (which is faster when generating many classes).
+
+    Parameters:
+        names_metadata: An iterable of `(name, metadata)` tuples.
+        module: Specify the value for the class definitions'
+            `__module__` property. The invoking module will be
+            used if this is not specified (see `get_model_from_meta`).
+        docstrings: A mapping of class names to docstrings.
+        pre_init_sources: A mapping of class names to source code to insert
+            *before* the `__init__` function in each class definition.
+        post_init_sources: A mapping of class names to source code to insert
+            *after* the `__init__` function in each class definition.
+    """
+    module = module or get_calling_module_name(2)
+    docstrings = docstrings or {}
+    pre_init_sources = pre_init_sources or {}
+    post_init_sources = post_init_sources or {}
+    names_metadata = tuple(names_metadata)
+    names: tuple[str, ...] = tuple(map(_get_item_key, names_metadata))
+    if len(set(names)) != len(names):
+        message: str = f"Class names must be unique: {names!r}"
+        raise ValueError(message)
+    name: str
+    metadata: abc.Meta
+    imports_sources: list[str] = []
+    class_sources: list[str] = []
+    for name, metadata in names_metadata:
+        imports_source: str
+        class_source: str
+        imports_source, class_source = _get_model_imports_and_class_source(
+            name,
+            metadata,
+            module=module,
+            docstring=docstrings.get(name),
+            pre_init_source=pre_init_sources.get(name, ""),
+            post_init_source=post_init_sources.get(name, ""),
+        )
+        imports_sources.append(imports_source)
+        class_sources.append(class_source)
+    # All imports are placed at the top of the combined source (de-duplicated,
+    # since `from __future__` imports must come first)
+    source: str = "\n\n\n".join(
+        (
+            "\n".join(
+                dict.fromkeys(
+                    chain.from_iterable(
+                        imports_source.split("\n")
+                        for imports_source in imports_sources
+                    )
+                )
+            ),
+            *class_sources,
+        )
+    )
+    namespace: dict[str, Any] = {"__name__": f"from_meta_{'_'.join(names)}"}
+    error: Exception
+    try:
+        exec(  # noqa: S102
+            _compile_model_source(source, ", ".join(names)), namespace
+        )
+    except Exception as error:
+        append_exception_text(error, f"\n\n{source}")
+        raise
+    model_classes: list[type[abc.Model]] = []
+    for (name, metadata), imports_source, class_source in zip(
+        names_metadata, imports_sources, class_sources, strict=True
+    ):
+        model_class: type[abc.Model] = namespace[name]
+        # Each class's source is the same as if it were generated using
+        # `get_model_from_meta`
+        model_class._source = (  # noqa: SLF001
+            f"{imports_source}\n\n\n{class_source}"
+        )
+        model_class.__module__ = module
+        model_class._class_meta = metadata  # noqa: SLF001
+        model_classes.append(model_class)
+    return tuple(model_classes)
+
+
+def _get_model_imports_and_class_source(
+    name: str,
+    metadata: abc.Meta,
+    module: str,
+    docstring: str | None = None,
+    pre_init_source: str = "",
+    post_init_source: str = "",
+) -> tuple[str, str]:
+    """
+    Get the imports and class definition for a model generated from
+    metadata.
+    """
+    class_definition: str = _class_definition_from_meta(
+        name,
+        metadata,
+        docstring=docstring,
+        module=module,
+        pre_init_source=pre_init_source,
+        post_init_source=post_init_source,
+    )
+    # `decimal.Decimal` and `datetime` may or may not be referenced in a
+    # given model--so check first, and select the corresponding import block
+    imports_source: str = _IMPORTS_SOURCES[
+        (
+            (
+                ("decimal.Decimal" in class_definition)
+                and (_DECIMAL_RE.search(class_definition) is not None)
+            )
+            << 1
+        )
+        | (
+            ("datetime" in class_definition)
+            and (_DATETIME_RE.search(class_definition) is not None)
+        )
+    ]
+    # Import lines are never long, so only the class definition needs
+    # long lines suffixed
+    return imports_source, suffix_long_lines(class_definition)
+
+
+# Metadata types mapped to the model type name used in the corresponding
+# `sob.get_writable_..._meta` function, and the name of the metadata attribute
+# defining the model's properties or item/value types
+_META_TYPES_NAMES: tuple[tuple[type, str, str], ...] = (
+    (abc.ObjectMeta, "object", "properties"),
+    (abc.ArrayMeta, "array", "item_types"),
+    (abc.DictionaryMeta, "dictionary", "value_types"),
+)
+
+
+@lru_cache(maxsize=64)
+def _get_meta_type_names(meta_type: type) -> tuple[str, str] | None:
+    """
+    Get the model type name and typing attribute name for a metadata class
+    (or `None`, if it is not object, array, or dictionary metadata). This is
+    cached, so that each metadata class is only matched once.
+    """
+    type_: type
+    model_type_name: str
+    attribute_name: str
+    for type_, model_type_name, attribute_name in _META_TYPES_NAMES:
+        if issubclass(meta_type, type_):
+            return model_type_name, attribute_name
+    return None
+
+
 def _get_class_meta_attribute_assignment_source(
     class_name_: str,
     attribute_name: str,
@@ -3436,22 +3988,54 @@ def _get_class_meta_attribute_assignment_source(
     - metadata (sob.abc.Meta): The metadata from which to take the assigned
       value.
     """
+    meta_type_names: tuple[str, str] | None = _get_meta_type_names(
+        type(metadata)
+    )
     writable_function_name: str = "sob.get_writable_{}_meta".format(
-        "object"
-        if isinstance(metadata, abc.ObjectMeta)
-        else ("array" if isinstance(metadata, abc.ArrayMeta) else "dictionary")
+        "dictionary" if meta_type_names is None else meta_type_names[0]
     )
     # We insert "  # type: ignore" at the end of the first line where the value
     # is assigned due to mypy issues with properties having getters and setters
-    return suffix_long_lines(
-        (
-            f"{writable_function_name}(\n"
-            f"    {suffix_long_lines(class_name_, -4)}\n"
-            f").{attribute_name} = "
-            f"{represent(getattr(metadata, attribute_name))}"
-        ),
-        -4,
+    source: str = (
+        f"{writable_function_name}(\n"
+        f"    {class_name_}\n"
+        f").{attribute_name} = "
+        f"{represent(getattr(metadata, attribute_name))}"
     )
+    # Long lines (including the class name line) only need to be suffixed if
+    # there are any, so we check first (which is much faster)
+    if max(map(len, source.split("\n"))) <= MAX_LINE_LENGTH - 4:
+        return source
+    return suffix_long_lines(source, -4)
+
+
+def _get_model_source_imports_and_class(
+    model_class: type[abc.Model],
+) -> tuple[tuple[str, ...], str]:
+    """
+    Get the import lines and class definition from a model class's source.
+    For classes with a stored `_source` (such as those generated using
+    `get_model_from_meta`), the result is cached on the class (along with
+    the source it was parsed from, so that it is not used if the source
+    changes).
+    """
+    source: str = get_source(model_class)
+    parsed_source: tuple[str, tuple[str, ...], str] | None = (
+        model_class._parsed_source  # noqa: SLF001
+    )
+    if (parsed_source is not None) and (parsed_source[0] is source):
+        return parsed_source[1], parsed_source[2]
+    import_source: str
+    class_source: str
+    import_source, class_source = source.strip().rpartition("\n\n\n")[::2]
+    import_lines: tuple[str, ...] = tuple(import_source.splitlines())
+    if source is model_class._source:  # noqa: SLF001
+        model_class._parsed_source = (  # noqa: SLF001
+            source,
+            import_lines,
+            class_source,
+        )
+    return import_lines, class_source
 
 
 def get_models_source(*model_classes: type[abc.Model]) -> str:
@@ -3460,58 +4044,53 @@ def get_models_source(*model_classes: type[abc.Model]) -> str:
     This is useful for generating a module from classes generated
     using `get_model_from_meta`.
     """
+    # Imports are de-duplicated as they are added, preserving order
     import_source_lines: list[str] = []
+    append_import_source_line: Callable[[str], None] = (
+        import_source_lines.append
+    )
+    import_source_lines_set: set[str] = set()
+    add_import_source_line: Callable[[str], None] = import_source_lines_set.add
+    import_line: str
     class_sources: list[str] = []
+    # Metadata assignments are keyed by class name, so that each class's
+    # metadata is only assigned once
+    metadata_sources: dict[str, str] = {}
     model_class: type[abc.Model]
-    class_names_metadata: dict[
-        str, abc.ObjectMeta | abc.ArrayMeta | abc.DictionaryMeta
-    ] = {}
     for model_class in model_classes:
-        import_source: str
+        import_lines: tuple[str, ...]
         class_source: str
-        import_source, class_source = (
-            get_source(model_class).strip().rpartition("\n\n\n")[::2]
+        import_lines, class_source = _get_model_source_imports_and_class(
+            model_class
         )
-        import_source_lines.extend(import_source.splitlines())
+        for import_line in import_lines:
+            if import_line not in import_source_lines_set:
+                add_import_source_line(import_line)
+                append_import_source_line(import_line)
         class_sources.append(class_source)
-        meta_instance: abc.Meta | None = meta.read_model_meta(model_class)
-        if not isinstance(
-            meta_instance,
-            (abc.ObjectMeta, abc.ArrayMeta, abc.DictionaryMeta),
-        ):
-            raise TypeError(meta_instance)
-        class_names_metadata[model_class.__name__] = meta_instance
-    class_name: str
-    metadata: abc.ObjectMeta | abc.ArrayMeta | abc.DictionaryMeta
-    metadata_sources: list[str] = []
-    for class_name, metadata in class_names_metadata.items():
-        if not isinstance(
-            metadata, (abc.ObjectMeta, abc.ArrayMeta, abc.DictionaryMeta)
-        ):
+        metadata: abc.Meta | None = meta.read_model_meta(model_class)
+        # `type(None)` is not a metadata class, so `None` is rejected before
+        # the (cached) look-up
+        if metadata is None:
             raise TypeError(metadata)
-        if isinstance(metadata, abc.ObjectMeta):
-            metadata_sources.append(
-                _get_class_meta_attribute_assignment_source(
-                    class_name, "properties", metadata
-                )
-            )
-        elif isinstance(metadata, abc.ArrayMeta):
-            metadata_sources.append(
-                _get_class_meta_attribute_assignment_source(
-                    class_name, "item_types", metadata
-                )
-            )
-        else:
-            metadata_sources.append(
-                _get_class_meta_attribute_assignment_source(
-                    class_name, "value_types", metadata
-                )
+        meta_type_names: tuple[str, str] | None = _get_meta_type_names(
+            type(metadata)
+        )
+        if meta_type_names is None:
+            raise TypeError(metadata)
+        metadata_sources[model_class.__name__] = (
+            _get_class_meta_attribute_assignment_source(
+                model_class.__name__, meta_type_names[1], metadata
             )
-    # De-duplicate imports while preserving order
-    imports_source = "\n".join(dict.fromkeys(import_source_lines).keys())
-    classes_source: str = "\n\n\n".join(class_sources)
-    metadata_source: str = "\n".join(metadata_sources)
-    return f"{imports_source}\n\n\n{classes_source}\n\n\n{metadata_source}"
+        )
+    # The module source is assembled with a single join
+    return "\n\n\n".join(
+        (
+            "\n".join(import_source_lines),
+            *class_sources,
+            "\n".join(metadata_sources.values()),
+        )
+    )
 
 
 from_meta = deprecated(
@@ -10,9 +10,11 @@ from collections.abc import Callable, Iterable, Sequence
 from copy import deepcopy
 from datetime import date, datetime
 from decimal import Decimal
+from functools import lru_cache
 from typing import (
     TYPE_CHECKING,
     Any,
+    cast,
 )
 
 from sob import abc
@@ -21,7 +23,7 @@ from sob._datetime import datetime2str as _datetime2str
 from sob._datetime import str2date as _str2date
 from sob._datetime import str2datetime as _str2datetime
 from sob._inspect import get_parameters_defaults
-from sob._types import UNDEFINED, NoneType, Undefined
+from sob._types import UNDEFINED, Undefined
 from sob._utilities import deprecated
 from sob.types import MutableTypes, Types
 from sob.utilities import (
@@ -36,22 +38,23 @@ if TYPE_CHECKING:
     from sob.abc import MarshallableTypes
 
 
-def _repr_keyword_argument_assignment(
-    argument: str,
-    value: MarshallableTypes,
-    defaults: dict[str, MarshallableTypes] | None = None,
-) -> str | None:
-    """
-    Returns a string representation of an argument assignment, or `None`
-    if the argument value is equal to the default value for that argument
-    """
-    if (defaults is not None) and (
-        (argument not in defaults)
-        or defaults[argument] == value
-        or value is None
-    ):
-        return None
-    return f"    {argument}={indent(represent(value))},"
+# Immutable types shared by all instances of the property classes which
+# define their types at the class-level
+_STR_TYPES: abc.Types = Types((str,))
+_DATE_TYPES: abc.Types = Types((date,))
+_DATETIME_TYPES: abc.Types = Types((datetime,))
+_BYTES_TYPES: abc.Types = Types((bytes,))
+# Number types are ordered by the frequency with which they are expected to
+# be encountered, since values are un-marshalled by attempting each type in
+# order, and JSON integers are most common
+_NUMBER_TYPES: abc.Types = Types((int, float, Decimal))
+_INTEGER_TYPES: abc.Types = Types((int,))
+_BOOLEAN_TYPES: abc.Types = Types((bool,))
+_ARRAY_TYPES: abc.Types = Types((abc.Array,))
+_DICTIONARY_TYPES: abc.Types = Types((abc.Dictionary,))
+
+# Concrete types collection classes, checked for by exact type
+_TYPES_CLASSES: frozenset[type] = frozenset((Types, MutableTypes))
 
 
 def has_mutable_types(property_: abc.Property | type[abc.Property]) -> bool:
@@ -62,16 +65,69 @@ def has_mutable_types(property_: abc.Property | type[abc.Property]) -> bool:
     Parameters:
         property:
     """
-    property_type: type
-    if isinstance(property_, abc.Property):
-        property_type = type(property_)
-    else:
-        if not issubclass(property_, abc.Property):
-            raise TypeError(property_)
-        property_type = property_
+    # Checking for a class with `isinstance(..., type)` avoids an abstract
+    # base class instance check
+    property_type: type = (
+        property_ if isinstance(property_, type) else type(property_)
+    )
+    if not issubclass(property_type, abc.Property):
+        raise TypeError(property_)
     return property_type._types is None  # noqa: SLF001
 
 
+# Private attributes copied (without a deep copy) when copying a property
+_SHALLOW_COPY_ATTRIBUTE_NAMES: tuple[str, ...] = (
+    "_types",
+    "_date2str",
+    "_str2date",
+    "_datetime2str",
+    "_str2datetime",
+)
+# Public attributes which are copied by way of their private counterparts
+_NOT_COPIED_ATTRIBUTE_NAMES: frozenset[str] = frozenset(
+    (
+        "types",
+        "date2str",
+        "str2date",
+        "datetime2str",
+        "str2datetime",
+    )
+)
+
+
+@lru_cache(maxsize=256)
+def _get_copied_class_attribute_names(
+    property_type: type[abc.Property],
+) -> frozenset[str]:
+    """
+    Get the names of public, non-callable class attributes (including
+    properties) which should be copied when copying an instance of a property
+    class.
+    """
+    return frozenset(
+        attribute_name
+        for attribute_name in dir(property_type)
+        if not (
+            attribute_name.startswith("_")
+            or (attribute_name in _NOT_COPIED_ATTRIBUTE_NAMES)
+            or callable(getattr(property_type, attribute_name, None))
+        )
+    )
+
+
+@lru_cache(maxsize=256)
+def _get_init_parameters_defaults(
+    property_type: type[abc.Property],
+) -> dict[str, Any]:
+    """
+    Get the default values for the parameters of a property class's
+    `__init__` method. This is cached, so that the signature of each class's
+    `__init__` is only inspected once. The returned dictionary must not be
+    modified.
+    """
+    return get_parameters_defaults(property_type.__init__)
+
+
 class Property(abc.Property):
     """
     This is the base class for defining a property.
@@ -161,16 +217,18 @@ class Property(abc.Property):
                 f"`{get_qualified_name(type(self))}.types` is immutable"
             )
             raise TypeError(message)
-        if (types_or_properties is not None) and not isinstance(
+        types_: abc.Types | None
+        # The concrete `sob.types` classes are checked for first, since this
+        # is much faster than an abstract base class instance check
+        if type(types_or_properties) in _TYPES_CLASSES:
+            types_ = cast("abc.Types", types_or_properties)
+        elif (types_or_properties is None) or isinstance(
             types_or_properties, abc.Types
         ):
-            types_or_properties = MutableTypes(types_or_properties)
-        if not (
-            (types_or_properties is None)
-            or isinstance(types_or_properties, abc.Types)
-        ):
-            raise TypeError(types_or_properties)
-        self._types = types_or_properties
+            types_ = types_or_properties
+        else:
+            types_ = MutableTypes(types_or_properties)
+        self._types = types_
 
     @property  # type: ignore
     def versions(self) -> Sequence[abc.Version] | None:
@@ -186,82 +244,123 @@ class Property(abc.Property):
     ) -> None:
         versions_tuple: tuple[abc.Version, ...] | None = None
         if versions is not None:
-            if not isinstance(
-                versions, (str, abc.Version, collections.abc.Iterable)
+            # Strings are checked for first, as the most common (and least
+            # expensive to check) case. Exact types are checked for before
+            # each abstract base class instance check.
+            versions_type: type = type(versions)
+            if isinstance(versions, str):
+                versions_tuple = (Version(versions),)
+            elif versions_type is Version or isinstance(versions, abc.Version):
+                versions_tuple = (versions,)  # type: ignore
+            elif not (
+                versions_type is tuple
+                or versions_type is list
+                or isinstance(versions, collections.abc.Iterable)
             ):
                 raise TypeError(versions)
-            version: str | abc.Version
-            if isinstance(versions, str):
-                version = Version(versions)
-                versions_tuple = (version,)
-            elif isinstance(versions, abc.Version):
-                versions_tuple = (versions,)
+            elif versions_type is tuple and all(
+                type(version) is Version
+                for version in versions  # type: ignore
+            ):
+                # A tuple of versions (as when copying a property) is
+                # immutable, so it can be used as-is
+                versions_tuple = versions  # type: ignore
             else:
-                versions_list: list[abc.Version] = []
-                for version in versions:
-                    if not isinstance(version, abc.Version):
-                        version = Version(version)  # noqa: PLW2901
-                    versions_list.append(version)
-                versions_tuple = tuple(versions_list)
+                versions_tuple = tuple(
+                    version
+                    if type(version) is Version
+                    or isinstance(version, abc.Version)
+                    else Version(version)
+                    for version in versions  # type: ignore
+                )
         self._versions = versions_tuple
 
     def __repr__(self) -> str:
-        lines = [get_qualified_name(type(self)) + "("]
-        defaults: dict[str, Any] = get_parameters_defaults(
-            self.__init__  # type: ignore
-        )
+        qualified_name: str = get_qualified_name(type(self))
+        defaults: dict[str, Any] = _get_init_parameters_defaults(type(self))
+        # Only arguments accepted by `__init__`, and having a value which
+        # differs from the argument's default, are represented
+        arguments_representations: list[str] = []
+        property_name: str
+        value: Any
+        default: Any
         for property_name, value in iter_properties_values(self):
-            argument_representation = _repr_keyword_argument_assignment(
-                property_name, value, defaults
+            if (value is None) or (property_name not in defaults):
+                continue
+            default = defaults[property_name]
+            # Identity is checked before equality, since most values which
+            # are unchanged from their default are singletons (`False`, etc.)
+            if (default is value) or default == value:
+                continue
+            arguments_representations.append(
+                f"    {property_name}={indent(represent(value))}"
             )
-            if argument_representation is not None:
-                lines.append(argument_representation)
-        lines[-1] = lines[-1].rstrip(",")
-        lines.append(")")
-        if len(lines) > 2:  # noqa: PLR2004
-            return "\n".join(lines)
-        return "".join(lines)
+        if not arguments_representations:
+            return f"{qualified_name}()"
+        return (
+            f"{qualified_name}(\n"
+            + ",\n".join(arguments_representations)
+            + "\n)"
+        )
 
     def _copy(self, *, deep: bool, memo: dict | None = None) -> abc.Property:
         new_instance = self.__class__()
         attribute_name: str
-        for attribute_name in dir(self):
-            if attribute_name in (
-                "_types",
-                "_date2str",
-                "_str2date",
-                "_datetime2str",
-                "_str2datetime",
-            ):
-                setattr(
-                    new_instance, attribute_name, getattr(self, attribute_name)
-                )
-            elif not (
-                attribute_name.startswith("_")
-                or (
-                    attribute_name
-                    in (
-                        "types",
-                        "date2str",
-                        "str2date",
-                        "datetime2str",
-                        "str2datetime",
-                    )
+        value: Any
+        for attribute_name in _SHALLOW_COPY_ATTRIBUTE_NAMES:
+            value = getattr(self, attribute_name, UNDEFINED)
+            if value is not UNDEFINED:
+                setattr(new_instance, attribute_name, value)
+        # Rather than inspecting every attribute (including methods) with
+        # `dir`, we combine the names of the class's public data descriptors
+        # and attributes (determined once per class) with the names of public
+        # instance attributes
+        class_attribute_names: frozenset[str] = (
+            _get_copied_class_attribute_names(type(self))
+        )
+        for attribute_name in sorted(
+            class_attribute_names.union(
+                attribute_name
+                for attribute_name in vars(self)
+                if not (
+                    attribute_name.startswith("_")
+                    or attribute_name in _NOT_COPIED_ATTRIBUTE_NAMES
                 )
-            ):
-                value = getattr(self, attribute_name)
-                if deep:
-                    value = deepcopy(value, memo=memo)
-                if not callable(value):
-                    setattr(new_instance, attribute_name, value)
+            )
+        ):
+            value = getattr(self, attribute_name)
+            if deep:
+                value = deepcopy(value, memo=memo)
+            if not callable(value):
+                setattr(new_instance, attribute_name, value)
         return new_instance
 
     def __copy__(self) -> abc.Property:
         return self._copy(deep=False)
 
     def __deepcopy__(self, memo: dict) -> abc.Property:
+        if (type(self) in _SCALAR_PROPERTY_TYPES) and (
+            vars(self).keys() == _SCALAR_PROPERTY_ATTRIBUTE_NAMES
+        ):
+            return self._deepcopy_scalar(memo)
         return self._copy(deep=True, memo=memo or {})
 
+    def _deepcopy_scalar(self, memo: dict) -> abc.Property:
+        """
+        Deep-copy a property with class-level (immutable) types, and no state
+        other than that assigned by `Property.__init__`. Only the versions
+        (if any) need to be deep-copied, since the types, name, and
+        required flag are immutable.
+        """
+        new_instance: Property = self.__class__.__new__(self.__class__)
+        new_instance._types = self._types  # noqa: SLF001
+        new_instance.name = self.name
+        new_instance.required = self.required
+        new_instance._versions = (  # noqa: SLF001
+            None if self._versions is None else deepcopy(self._versions, memo)
+        )
+        return new_instance
+
 
 class StringProperty(Property, abc.StringProperty):
     """
@@ -294,7 +393,7 @@ class StringProperty(Property, abc.StringProperty):
 
     __module__: str = "sob"
 
-    _types: abc.Types = Types((str,))  # type: ignore
+    _types: abc.Types = _STR_TYPES  # type: ignore
 
     def __init__(
         self,
@@ -350,7 +449,7 @@ class DateProperty(Property, abc.DateProperty):
 
     __module__: str = "sob"
 
-    _types: abc.Types | None = Types((date,))
+    _types: abc.Types | None = _DATE_TYPES
 
     def __init__(
         self,
@@ -430,7 +529,7 @@ class DateTimeProperty(Property, abc.DateTimeProperty):
 
     __module__: str = "sob"
 
-    _types: abc.Types = Types((datetime,))  # type: ignore
+    _types: abc.Types = _DATETIME_TYPES  # type: ignore
 
     def __init__(
         self,
@@ -509,7 +608,7 @@ class BytesProperty(Property, abc.BytesProperty):
 
     __module__: str = "sob"
 
-    _types: abc.Types = Types((bytes,))  # type: ignore
+    _types: abc.Types = _BYTES_TYPES  # type: ignore
 
     def __init__(
         self,
@@ -534,6 +633,13 @@ Bytes = deprecated(
 )(BytesProperty)
 
 
+# Built-in collection types accepted for enumerated property values without
+# an abstract base class instance check
+_VALUES_COLLECTION_TYPES: frozenset[type] = frozenset(
+    (set, frozenset, list, tuple)
+)
+
+
 class EnumeratedProperty(Property, abc.EnumeratedProperty):
     """
     This class represents metadata describing a property having a finite,
@@ -599,7 +705,12 @@ class EnumeratedProperty(Property, abc.EnumeratedProperty):
         if values is None:
             self._values = None
         else:
-            if not isinstance(values, collections.abc.Iterable):
+            # Common built-in collection types are checked for first, since
+            # this is much faster than an abstract base class instance check
+            if not (
+                (type(values) in _VALUES_COLLECTION_TYPES)
+                or isinstance(values, collections.abc.Iterable)
+            ):
                 raise TypeError(values)
             self._values = set(values)
 
@@ -642,7 +753,7 @@ class NumberProperty(Property, abc.NumberProperty):
 
     __module__: str = "sob"
 
-    _types: abc.Types = Types((Decimal, float, int))  # type: ignore
+    _types: abc.Types = _NUMBER_TYPES  # type: ignore
 
     def __init__(
         self,
@@ -695,7 +806,7 @@ class IntegerProperty(Property, abc.IntegerProperty):
 
     __module__: str = "sob"
 
-    _types: abc.Types = Types((int,))  # type: ignore
+    _types: abc.Types = _INTEGER_TYPES  # type: ignore
 
     def __init__(
         self,
@@ -752,7 +863,7 @@ class BooleanProperty(Property, abc.BooleanProperty):
 
     __module__: str = "sob"
 
-    _types: abc.Types = Types((bool,))  # type: ignore
+    _types: abc.Types = _BOOLEAN_TYPES  # type: ignore
 
     def __init__(
         self,
@@ -777,6 +888,23 @@ Boolean = deprecated(
 )(BooleanProperty)
 
 
+# Property classes with class-level types, and no state other than that
+# assigned by `Property.__init__`, which can be deep-copied without inspecting
+# their attributes (sub-classes are excluded, as they may add state)
+_SCALAR_PROPERTY_TYPES: frozenset[type[Property]] = frozenset(
+    (
+        StringProperty,
+        BytesProperty,
+        NumberProperty,
+        IntegerProperty,
+        BooleanProperty,
+    )
+)
+_SCALAR_PROPERTY_ATTRIBUTE_NAMES: frozenset[str] = frozenset(
+    ("_types", "name", "required", "_versions")
+)
+
+
 class ArrayProperty(Property, abc.ArrayProperty):
     """
     This class represents metadata describing a property accepting array
@@ -812,7 +940,7 @@ class ArrayProperty(Property, abc.ArrayProperty):
 
     __module__: str = "sob"
 
-    _types: abc.Types = Types((abc.Array,))  # type: ignore
+    _types: abc.Types = _ARRAY_TYPES  # type: ignore
     _item_types: abc.Types | None = None
 
     def __init__(
@@ -852,24 +980,28 @@ class ArrayProperty(Property, abc.ArrayProperty):
         | abc.Types
         | None,
     ) -> None:
-        if isinstance(item_types, abc.Types):
-            if not isinstance(item_types, abc.MutableTypes):
-                item_types = MutableTypes(item_types)
-        elif item_types is not None:
-            item_types_list: list[type | abc.Property] = []
-            if isinstance(item_types, (type, abc.Property)):
-                item_types_list.append(item_types)
+        # Exact types are checked for first, since this is much faster than
+        # an abstract base class instance check
+        item_types_type: type = type(item_types)
+        is_list_or_tuple: bool = (item_types_type is list) or (
+            item_types_type is tuple
+        )
+        if (item_types is None) or (item_types_type is MutableTypes):
+            pass
+        elif is_list_or_tuple or not isinstance(item_types, abc.Types):
+            # Each item is validated by `sob.MutableTypes`, so we only need to
+            # verify that we have a single type/property, or a sequence
+            if (not is_list_or_tuple) and isinstance(
+                item_types, (type, abc.Property)
+            ):
+                item_types = MutableTypes((item_types,))  # type: ignore
             else:
-                if not isinstance(item_types, Sequence):
+                if not (is_list_or_tuple or isinstance(item_types, Sequence)):
                     raise TypeError(item_types)
-                for item_type in item_types:
-                    if not isinstance(item_type, (type, abc.Property)):
-                        raise TypeError(item_type)
-                    item_types_list.append(item_type)
-            item_types = MutableTypes(item_types_list)
-        if not isinstance(item_types, (abc.Types, NoneType)):
-            raise TypeError(item_types)
-        self._item_types = item_types
+                item_types = MutableTypes(item_types)  # type: ignore
+        elif not isinstance(item_types, abc.MutableTypes):
+            item_types = MutableTypes(item_types)
+        self._item_types = item_types  # type: ignore
 
 
 Array = deprecated(
@@ -914,7 +1046,7 @@ class DictionaryProperty(Property, abc.DictionaryProperty):
 
     __module__: str = "sob"
 
-    _types: abc.Types = Types((abc.Dictionary,))  # type: ignore
+    _types: abc.Types = _DICTIONARY_TYPES  # type: ignore
     _value_types: abc.Types | None = None
 
     def __init__(
@@ -962,12 +1094,14 @@ class DictionaryProperty(Property, abc.DictionaryProperty):
         `sob.errors.ValidationError`, the value type occurring *first* in the
         sequence will be used.
         """
-        if (value_types is not None) and not isinstance(
-            value_types, abc.MutableTypes
+        # `sob.MutableTypes` is checked for by exact type first, since this is
+        # much faster than an abstract base class instance check
+        if not (
+            (value_types is None)
+            or (type(value_types) is MutableTypes)
+            or isinstance(value_types, abc.MutableTypes)
         ):
             value_types = MutableTypes(value_types)
-        if not isinstance(value_types, (abc.Types, NoneType)):
-            raise TypeError(value_types)
         self._value_types = value_types
 
 
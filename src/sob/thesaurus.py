@@ -805,13 +805,15 @@ class Synonyms:
                         property_type: type | abc.Property = next(
                             iter(property_.types)
                         )
-                        if (
-                            isinstance(property_type, type)
-                            and property_type in TYPES_PROPERTIES
-                        ):
+                        property_class: type | None = (
+                            TYPES_PROPERTIES.get(property_type)
+                            if isinstance(property_type, type)
+                            else None
+                        )
+                        if property_class is not None:
                             metadata.properties[property_name_] = (
-                                TYPES_PROPERTIES[property_type]
-                            )(name=property_.name)
+                                property_class(name=property_.name)
+                            )
                     else:
                         # Make the property types immutable
                         property_.types = Types(property_.types)
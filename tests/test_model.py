@@ -3,7 +3,7 @@ from __future__ import annotations
 import doctest
 import os
 from base64 import b64encode
-from copy import deepcopy
+from copy import copy, deepcopy
 from datetime import date, datetime
 from decimal import Decimal
 from pathlib import Path
@@ -623,6 +623,252 @@ def test_copy() -> None:
     assert testy.string2string2c_b_a["one"]["c"] is not None
 
 
+class PropertyTypes(sob.Object):
+    __slots__: tuple[str, ...] = (
+        "array",
+        "dictionary",
+        "enumerated",
+        "number",
+        "string",
+    )
+
+    def __init__(
+        self,
+        _data: dict | None = None,
+        string: str | None = None,
+        number: float | Decimal | None = None,
+        array: sob.Array | list[int] | None = None,
+        dictionary: sob.Dictionary | dict[str, str] | None = None,
+        enumerated: int | None = None,
+    ) -> None:
+        self.string: str | None = string
+        self.number: float | Decimal | None = number
+        self.array: sob.Array | list[int] | None = array
+        self.dictionary: sob.Dictionary | dict[str, str] | None = dictionary
+        self.enumerated: int | None = enumerated
+        super().__init__(_data)
+
+
+sob.get_writable_object_meta(PropertyTypes).properties = [  # type: ignore
+    ("string", sob.StringProperty()),
+    ("number", sob.NumberProperty()),
+    ("array", sob.ArrayProperty(item_types=(int,))),
+    ("dictionary", sob.DictionaryProperty(value_types=(str,))),
+    ("enumerated", sob.EnumeratedProperty(values=(1, 2))),
+]
+
+
+@pytest.mark.parametrize("set_attribute_hooks", (False, True))
+def test_deepcopy_property_types(*, set_attribute_hooks: bool) -> None:
+    """
+    Verify that deep-copying an object copies a property of each type, and
+    that mutable values are not shared with the original.
+    """
+    property_types: PropertyTypes = PropertyTypes(
+        string="a",
+        number=Decimal("1.5"),
+        array=[1, 2],
+        dictionary={"a": "b"},
+        enumerated=2,
+    )
+    hook_property_names: list[str] = []
+
+    def before_setattr(
+        _object: sob.abc.Object, name: str, value: sob.abc.MarshallableTypes
+    ) -> tuple[str, sob.abc.MarshallableTypes]:
+        hook_property_names.append(name)
+        return name, value
+
+    if set_attribute_hooks:
+        # With set-attribute hooks, values are assigned using `setattr`
+        sob.write_model_hooks(
+            property_types, sob.ObjectHooks(before_setattr=before_setattr)
+        )
+    property_types_copy: PropertyTypes = deepcopy(property_types)
+    assert property_types_copy == property_types
+    assert property_types_copy is not property_types
+    property_name: str
+    for property_name in PropertyTypes.__slots__:
+        assert getattr(property_types_copy, property_name) == getattr(
+            property_types, property_name
+        )
+    assert property_types_copy.array is not property_types.array
+    assert property_types_copy.dictionary is not property_types.dictionary
+    assert isinstance(property_types_copy.array, sob.Array)
+    property_types_copy.array.append(3)
+    assert list(property_types.array or ()) == [1, 2]
+    if set_attribute_hooks:
+        # The last values assigned are the deep copies
+        assert hook_property_names[-5:] == [
+            "string",
+            "number",
+            "array",
+            "dictionary",
+            "enumerated",
+        ]
+
+
+def test_dictionary_copy() -> None:
+    """
+    Verify that a shallow copy of a dictionary is equal to, but distinct
+    from, the original, and that modifying the copy's metadata does not
+    affect the original.
+    """
+
+    class IntegerDictionary(sob.Dictionary):
+        pass
+
+    sob.get_writable_dictionary_meta(IntegerDictionary).value_types = (int,)
+    dictionary: IntegerDictionary = IntegerDictionary({"a": 1, "b": 2})
+    dictionary_copy: IntegerDictionary = copy(dictionary)
+    assert dictionary_copy == dictionary
+    assert dictionary_copy is not dictionary
+    dictionary_copy["c"] = 3
+    assert "c" not in dictionary
+    sob.get_writable_dictionary_meta(dictionary_copy).value_types = (int, str)
+    dictionary_meta: sob.abc.DictionaryMeta | None = sob.read_dictionary_meta(
+        dictionary
+    )
+    assert dictionary_meta is not None
+    assert list(dictionary_meta.value_types or ()) == [int]
+    # Instance metadata is carried over to a copy
+    dictionary_copy_copy: IntegerDictionary = copy(dictionary_copy)
+    assert dictionary_copy_copy == dictionary_copy
+    dictionary_copy_copy_meta: sob.abc.DictionaryMeta | None = (
+        sob.read_dictionary_meta(dictionary_copy_copy)
+    )
+    assert dictionary_copy_copy_meta is not None
+    assert list(dictionary_copy_copy_meta.value_types or ()) == [int, str]
+
+
+def test_marshal_collection() -> None:
+    """
+    Verify that collections of models, scalars, and mixtures of the two are
+    marshalled consistently, regardless of the order in which items
+    of each type occur.
+    """
+    object_a: ObjectA = ObjectA(
+        string="a", iso8601_datetime=datetime(1999, 12, 31, 23, 59, 59)
+    )
+    object_a_data: dict[str, sob.abc.JSONTypes] = {
+        "string": "a",
+        "iso8601DateTime": "1999-12-31T23:59:59Z",
+    }
+    property_types: PropertyTypes = PropertyTypes(
+        number=Decimal("1.5"), array=[1, 2]
+    )
+    property_types_data: dict[str, sob.abc.JSONTypes] = {
+        "number": 1.5,
+        "array": [1, 2],
+    }
+    assert sob.marshal([object_a, object_a]) == [object_a_data] * 2
+    assert sob.marshal(
+        [
+            object_a,
+            object_a,
+            1,
+            Decimal("2.5"),
+            datetime(2000, 1, 2, 3, 4, 5),
+            date(2000, 1, 2),
+            property_types,
+            [object_a, Decimal(3)],
+            None,
+        ]
+    ) == [
+        object_a_data,
+        object_a_data,
+        1,
+        2.5,
+        "2000-01-02T03:04:05Z",
+        "2000-01-02",
+        property_types_data,
+        [object_a_data, 3.0],
+        None,
+    ]
+    assert sob.marshal(("a", Decimal("2.5"), object_a, (property_types,))) == [
+        "a",
+        2.5,
+        object_a_data,
+        [property_types_data],
+    ]
+    assert sob.marshal([object_a, property_types, object_a]) == [
+        object_a_data,
+        property_types_data,
+        object_a_data,
+    ]
+
+
+def test_contains() -> None:
+    """
+    Verify membership tests for objects (by JSON property name), arrays
+    (by item), and dictionaries (by key).
+    """
+    object_a: ObjectA = ObjectA(string="a")
+    # Object membership is determined by the JSON property names, whether
+    # or not the property has a value
+    assert "string" in object_a
+    assert "boolean" in object_a
+    assert "iso8601DateTime" in object_a
+    assert "iso8601_datetime" not in object_a
+    assert "nonexistent" not in object_a
+    # Changes to an instance's metadata are reflected
+    object_a_properties: sob.abc.Properties | None = (
+        sob.get_writable_object_meta(object_a).properties
+    )
+    assert object_a_properties is not None
+    object_a_properties["string"].name = "stringValue"
+    assert "stringValue" in object_a
+    assert "string" not in object_a
+    assert "string" in ObjectA()
+    array: sob.Array = sob.Array([1, "two", None])
+    assert 1 in array
+    assert "two" in array
+    assert 2 not in array
+    assert "one" not in array
+    dictionary: sob.Dictionary = sob.Dictionary({"a": "one", "b": "two"})
+    assert "a" in dictionary
+    assert "b" in dictionary
+    assert "c" not in dictionary
+    assert "one" not in dictionary
+
+
+class UntypedObject(sob.Object):
+    __slots__: tuple[str, ...] = ("untyped",)
+
+    def __init__(
+        self,
+        _data: dict[str, sob.abc.MarshallableTypes] | None = None,
+        *,
+        untyped: sob.abc.MarshallableTypes | None = None,
+    ) -> None:
+        self.untyped: sob.abc.MarshallableTypes | None = untyped
+        super().__init__(_data)
+
+
+sob.get_writable_object_meta(UntypedObject).properties = [  # type: ignore
+    ("untyped", sob.Property()),
+]
+
+
+def test_unmarshal_untyped_dict() -> None:
+    """
+    Verify that a `dict` assigned to an untyped property is copied, whether
+    or not it has `None` values to replace.
+    """
+    data: dict[str, int] = {"a": 1, "b": 2}
+    untyped_object: UntypedObject = UntypedObject(untyped=data)
+    assert untyped_object.untyped == data
+    assert untyped_object.untyped is not data
+    untyped_object = UntypedObject({"untyped": data})
+    assert untyped_object.untyped == data
+    assert untyped_object.untyped is not data
+    data_with_none: dict[str, int | None] = {"a": 1, "b": None}
+    untyped_object = UntypedObject(untyped=data_with_none)
+    assert untyped_object.untyped == {"a": 1, "b": sob.NULL}
+    assert untyped_object.untyped is not data_with_none
+    assert data_with_none == {"a": 1, "b": None}
+
+
 def test_bytes_serialization() -> None:
     with open(
         RAINBOW_PNG,
@@ -635,6 +881,23 @@ def test_bytes_serialization() -> None:
         )
 
 
+def test_bytes_round_trip() -> None:
+    """
+    Verify that bytes property values survive a round trip through
+    marshalling and un-marshalling, both for values short enough to be
+    decoded using the cache and for longer values.
+    """
+    value: bytes
+    for value in (b"", b"sob", bytes(range(256)) * 8):
+        tesstee: Tesstee = Tesstee(rainbow=value)
+        data: dict = cast("dict", sob.marshal(tesstee))
+        assert data["rainbow"] == str(b64encode(value), "ascii")
+        assert Tesstee(data).rainbow == value
+        # A repeated (cached) decode produces the same value
+        assert Tesstee(data).rainbow == value
+        assert sob.unmarshal(data, types=(Tesstee,)) == tesstee
+
+
 def test_replicate_serialization() -> None:
     """
     This test verifies that a model can be serialized and deserialized
@@ -761,6 +1024,111 @@ def test_get_model_from_meta_regression() -> None:
             testee_model_io.write(tesstee_source)
 
 
+def test_get_model_from_meta_reuses_code() -> None:
+    """
+    Verify that regenerating a model from the same metadata creates a new
+    class, but re-uses the compiled code.
+    """
+    metadata: sob.ObjectMeta = cast(
+        "sob.ObjectMeta", sob.read_object_meta(ObjectA)
+    )
+    model_class: type[sob.abc.Model] = sob.get_model_from_meta(
+        "ObjectA", metadata, module=__name__
+    )
+    regenerated_model_class: type[sob.abc.Model] = sob.get_model_from_meta(
+        "ObjectA", metadata, module=__name__
+    )
+    assert regenerated_model_class is not model_class
+    assert (
+        regenerated_model_class.__init__.__code__
+        is model_class.__init__.__code__
+    )
+
+
+def test_get_models_from_meta() -> None:
+    """
+    Verify that `get_models_from_meta` generates the same classes (and source)
+    as `get_model_from_meta`.
+    """
+    names_metadata: tuple[tuple[str, sob.abc.Meta], ...] = (
+        ("ArrayA", cast("sob.ArrayMeta", sob.read_array_meta(ArrayA))),
+        ("ObjectA", cast("sob.ObjectMeta", sob.read_object_meta(ObjectA))),
+        ("Tesstee", cast("sob.ObjectMeta", sob.read_object_meta(Tesstee))),
+    )
+    docstrings: dict[str, str] = {"ObjectA": "An object."}
+    pre_init_sources: dict[str, str] = {
+        "Tesstee": "def pre_init(self) -> None:\n    pass"
+    }
+    post_init_sources: dict[str, str] = {
+        "ArrayA": "def post_init(self) -> None:\n    pass"
+    }
+    model_classes: tuple[type[sob.abc.Model], ...] = sob.get_models_from_meta(
+        names_metadata,
+        module=__name__,
+        docstrings=docstrings,
+        pre_init_sources=pre_init_sources,
+        post_init_sources=post_init_sources,
+    )
+    assert tuple(
+        model_class.__name__ for model_class in model_classes
+    ) == tuple(name for name, _ in names_metadata)
+    assert sob.get_models_source(*model_classes) == sob.get_models_source(
+        *(
+            sob.get_model_from_meta(
+                name,
+                metadata,
+                module=__name__,
+                docstring=docstrings.get(name),
+                pre_init_source=pre_init_sources.get(name, ""),
+                post_init_source=post_init_sources.get(name, ""),
+            )
+            for name, metadata in names_metadata
+        )
+    )
+    assert (model_classes[1].__doc__ or "").strip() == "An object."
+    assert hasattr(model_classes[2], "pre_init")
+    assert hasattr(model_classes[0], "post_init")
+    with pytest.raises(ValueError, match="unique"):
+        sob.get_models_from_meta(names_metadata * 2)
+
+
+def test_get_models_from_meta_cross_references() -> None:
+    """
+    Verify that classes generated together share a namespace, and can
+    reference one another.
+    """
+    object_a_class: type[sob.abc.Model]
+    array_a_class: type[sob.abc.Model]
+    object_a_class, array_a_class = sob.get_models_from_meta(
+        (
+            (
+                "ObjectA",
+                deepcopy(
+                    cast("sob.ObjectMeta", sob.read_object_meta(ObjectA))
+                ),
+            ),
+            (
+                "ArrayA",
+                deepcopy(cast("sob.ArrayMeta", sob.read_array_meta(ArrayA))),
+            ),
+        ),
+        module=__name__,
+    )
+    assert array_a_class.__init__.__globals__["ObjectA"] is object_a_class
+    assert object_a_class.__init__.__globals__["ArrayA"] is array_a_class
+    sob.get_writable_array_meta(
+        cast("type[sob.abc.Array]", array_a_class)
+    ).item_types = [object_a_class]  # type: ignore
+    array_a: sob.abc.Model = array_a_class([{"string": "a"}])
+    assert isinstance(array_a, sob.abc.Array)
+    assert type(array_a[0]) is object_a_class
+    assert sob.marshal(array_a) == [{"string": "a"}]
+    # The original classes' metadata is unchanged
+    assert list(
+        cast("sob.ArrayMeta", sob.read_array_meta(ArrayA)).item_types or ()
+    ) == [ObjectA]
+
+
 def test_replace_model_nulls() -> None:
     """
     Verify that `replace_model_nulls` replaces all instances of `sob.NULL`
@@ -771,5 +1139,48 @@ def test_replace_model_nulls() -> None:
     assert testy_copy.null_value is None
 
 
+def test_before_unmarshal_mutates_data() -> None:
+    """
+    Verify that data is only copied before being passed to a
+    `before_unmarshal` hook if the hook may modify its input.
+    """
+
+    class Point(sob.Object):
+        __slots__: tuple[str, ...] = ("x",)
+
+        def __init__(
+            self, _data: dict | None = None, *, x: int | None = None
+        ) -> None:
+            self.x = x
+            super().__init__(_data)
+
+    sob.get_writable_object_meta(Point).properties = [  # type: ignore
+        ("x", sob.IntegerProperty()),
+    ]
+    hook_data: list[sob.abc.MarshallableTypes] = []
+
+    def before_unmarshal(
+        data: sob.abc.MarshallableTypes,
+    ) -> sob.abc.MarshallableTypes:
+        hook_data.append(data)
+        return data
+
+    data: dict[str, int] = {"x": 1}
+    sob.write_model_hooks(
+        Point, sob.ObjectHooks(before_unmarshal=before_unmarshal)
+    )
+    assert sob.unmarshal(data, types=(Point,)) == Point(data)
+    assert hook_data.pop() is not data
+    sob.write_model_hooks(
+        Point,
+        sob.ObjectHooks(
+            before_unmarshal=before_unmarshal,
+            before_unmarshal_mutates_data=False,
+        ),
+    )
+    assert sob.unmarshal(data, types=(Point,)) == Point(data)
+    assert hook_data.pop() is data
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-s", "-vv"])
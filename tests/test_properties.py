@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from copy import deepcopy
+
+import pytest
+
+import sob
+
+
+class CustomStringProperty(sob.StringProperty):
+    pass
+
+
+@pytest.mark.parametrize(
+    "property_type",
+    (
+        sob.StringProperty,
+        sob.BytesProperty,
+        sob.NumberProperty,
+        sob.IntegerProperty,
+        sob.BooleanProperty,
+        CustomStringProperty,
+    ),
+)
+def test_deepcopy_scalar_property(
+    property_type: type[sob.abc.Property],
+) -> None:
+    """
+    Verify that scalar properties (including instances of sub-classes) are
+    deep-copied with their name, required flag, types, and versions, and
+    that the versions are not shared with the original.
+    """
+    property_: sob.abc.Property = property_type(
+        name="scalar", required=True, versions=("testy>1", "testy<3")
+    )
+    property_copy: sob.abc.Property = deepcopy(property_)
+    assert property_copy is not property_
+    assert type(property_copy) is property_type
+    assert property_copy.name == "scalar"
+    assert property_copy.required is True
+    assert property_copy.types == property_.types
+    assert property_copy.versions is not None
+    assert property_.versions is not None
+    assert list(map(str, property_copy.versions)) == ["testy>1", "testy<3"]
+    assert property_copy.versions is not property_.versions
+    assert not set(map(id, property_copy.versions)) & set(
+        map(id, property_.versions)
+    )
+    # Properties without versions are copied as well
+    property_ = property_type()
+    property_copy = deepcopy(property_)
+    assert type(property_copy) is property_type
+    assert property_copy.name is None
+    assert property_copy.required is False
+    assert property_copy.versions is None
+
+
+def test_deepcopy_scalar_property_attributes() -> None:
+    """
+    Verify that attributes assigned to a scalar property (in addition to
+    those assigned by `Property.__init__`) are deep-copied.
+    """
+    property_: sob.abc.Property = sob.StringProperty(name="scalar")
+    property_.description = ["A", "string"]  # type: ignore
+    property_copy: sob.abc.Property = deepcopy(property_)
+    assert type(property_copy) is sob.StringProperty
+    assert property_copy.name == "scalar"
+    assert property_copy.description == ["A", "string"]  # type: ignore
+    assert (
+        property_copy.description  # type: ignore
+        is not property_.description  # type: ignore
+    )
+
+
+@pytest.mark.parametrize(
+    ("item_types", "message"),
+    (
+        (3, "3"),
+        ("x", "x"),
+        ([3], "3"),
+        ((3,), "3"),
+        ([object], "<class 'object'>"),
+    ),
+)
+def test_array_property_invalid_item_types(
+    item_types: object, message: str
+) -> None:
+    """
+    Verify that invalid item types raise a `TypeError` identifying the
+    invalid value, whether passed to the constructor or assigned later.
+    """
+    with pytest.raises(TypeError) as exception_info:
+        sob.ArrayProperty(item_types=item_types)  # type: ignore
+    assert str(exception_info.value) == message
+    array_property: sob.ArrayProperty = sob.ArrayProperty()
+    with pytest.raises(TypeError) as exception_info:
+        array_property.item_types = item_types  # type: ignore
+    assert str(exception_info.value) == message
+
+
+@pytest.mark.parametrize(
+    ("value_types", "message"),
+    (
+        (3, "'int' object is not iterable"),
+        ("x", "x"),
+        ([3], "3"),
+        ((3,), "3"),
+        ([object], "<class 'object'>"),
+    ),
+)
+def test_dictionary_property_invalid_value_types(
+    value_types: object, message: str
+) -> None:
+    """
+    Verify that invalid value types raise a `TypeError` identifying the
+    invalid value, whether passed to the constructor or assigned later.
+    """
+    with pytest.raises(TypeError) as exception_info:
+        sob.DictionaryProperty(value_types=value_types)  # type: ignore
+    assert str(exception_info.value) == message
+    dictionary_property: sob.DictionaryProperty = sob.DictionaryProperty()
+    with pytest.raises(TypeError) as exception_info:
+        dictionary_property.value_types = value_types  # type: ignore
+    assert str(exception_info.value) == message